@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, TypedDict
 
 import yaml
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml (C)
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from pydantic import BaseModel, Field, validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -68,20 +73,37 @@ class RoomConfig(BaseModel):
     templates_confirmators: List[TemplateConfirmator] = []
 
 
-def _load_yaml(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+@lru_cache(maxsize=16)
+def _load_yaml_at(path_str: str, mtime_ns: int) -> dict:
+    # mtime_ns fait partie de la clé : un fichier modifié est relu
+    with open(path_str, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+def load_yaml_cached(path: Path) -> dict:
+    """
+    YAML parsé, mémoïsé par (chemin, mtime). Copie de surface : le niveau
+    racine peut être modifié, les sous-dicts sont partagés (lecture seule).
+    """
+    return dict(_load_yaml_at(str(path), path.stat().st_mtime_ns))
 
 
 def load_room_config(name: str, settings: Optional[AppSettings] = None) -> RoomConfig:
     """
     Charge rooms/<name>.yaml et retourne un RoomConfig validé.
+    Mémoïsé par (room, chemin, mtime) : un YAML modifié est rechargé ; l'instance
+    retournée est partagée entre appelants et ne doit pas être modifiée.
     """
     settings = settings or AppSettings()
     path = (settings.ROOMS_DIR / f"{name}.yaml").resolve()
     if not path.exists():
         raise FileNotFoundError(f"Room YAML not found: {path}")
-    data = _load_yaml(path)
+    return _load_room_config_at(name, str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_room_config_at(name: str, path_str: str, mtime_ns: int) -> RoomConfig:
+    data = dict(_load_yaml_at(path_str, mtime_ns))
 
     # Normalisation légère pour compat ascendantes
     data.setdefault("room", name)
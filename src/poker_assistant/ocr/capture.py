@@ -6,6 +6,8 @@ et le découpage d'images pour l'analyse OCR des tables poker.
 
 from __future__ import annotations
 
+import threading
+
 import numpy as np
 import mss
 import cv2
@@ -22,6 +24,38 @@ class CaptureError(Exception):
     pass
 
 
+# Contexte de capture par thread : la session mss (et ses DC/bitmap GDI) est gardée
+# d'un appel à l'autre au lieu d'être recréée à chaque grab
+_TLS = threading.local()
+
+
+def _sct():
+    sct = getattr(_TLS, "sct", None)
+    if sct is None:
+        sct = _TLS.sct = mss.mss()
+    return sct
+
+
+def close_capture() -> None:
+    """Ferme la session mss du thread courant (recréée au besoin au prochain grab)."""
+    sct = getattr(_TLS, "sct", None)
+    _TLS.sct = None
+    if sct is not None:
+        sct.close()
+
+
+def _grab_bgr(monitor: dict) -> np.ndarray:
+    try:
+        raw = _sct().grab(monitor)
+    except Exception:
+        # Session invalidée (changement d'écran/DPI) : on la recrée une fois
+        close_capture()
+        raw = _sct().grab(monitor)
+    # Vue sur le buffer BGRA de mss (sans copie), convertie en BGR en une passe
+    bgra = np.frombuffer(raw.raw, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+    return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
+
+
 def grab_window_bgr(bbox: Tuple[int, int, int, int]) -> np.ndarray:
     """Capture une zone d'écran et retourne l'image en format BGR.
     
@@ -41,11 +75,7 @@ def grab_window_bgr(bbox: Tuple[int, int, int, int]) -> np.ndarray:
     W, H = max(1, R - L), max(1, B - T)
     
     try:
-        with mss.mss() as sct:
-            raw = sct.grab({"left": L, "top": T, "width": W, "height": H})
-        
-        img = np.array(raw)  # BGRA format
-        return cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+        return _grab_bgr({"left": L, "top": T, "width": W, "height": H})
     except Exception as e:
         raise CaptureError(f"Erreur de capture d'écran {bbox}: {e}")
 
@@ -112,14 +142,8 @@ class ScreenCapture:
             if width <= 0 or height <= 0:
                 return None
             
-            # Capture avec mss
-            with mss.mss() as sct:
-                monitor = {"left": x, "top": y, "width": width, "height": height}
-                raw = sct.grab(monitor)
-            
-            # Conversion en numpy array BGR
-            img = np.array(raw)
-            return cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+            # Capture avec mss (session réutilisée) + conversion BGR
+            return _grab_bgr({"left": x, "top": y, "width": width, "height": height})
             
         except Exception as e:
             print(f"⚠️ Erreur capture fenêtre {handle}: {e}")
@@ -7,24 +7,66 @@
 #  - Alignement stable après redimensionnement (x1/y1 calculés via (x+w)/(y+h))
 #  - Base "table_zone" supportée (anchors.table_zone)
 #  - Capture robuste: PrintWindow(hwnd) d'abord; sinon ScreenCrop avec anti-miroir
+#  - Capture + redimensionnement dans un thread dédié ; la boucle Tk ne fait que l'affichage
 #
-# Dépendances : pillow, mss, pywin32, pyyaml
+# Dépendances : pillow, mss, pywin32, pyyaml (opencv-python optionnel : resize plus rapide)
 # pip install pillow mss pywin32 pyyaml
 
 from __future__ import annotations
 
+import ctypes
+import logging
 import os
+import queue
+import re
+import threading
 import time
-from typing import Optional, Tuple, Dict, Any
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Callable, Optional, Tuple, Dict, Any, List
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-from PIL import Image, ImageTk, ImageGrab
+import numpy as np
+from PIL import Image, ImageTk
+
+# Logger des chemins chauds (export, conversions ROI) ; voir _start_log_listener
+logger = logging.getLogger(__name__)
+_log_listener: Optional[QueueListener] = None
+_log_handler: Optional[QueueHandler] = None
+
+
+def _start_log_listener() -> None:
+    """Déporte l'écriture console des logs de l'aperçu dans un thread (QueueListener).
+
+    Uniquement si l'application n'a configuré aucun handler : sinon les enregistrements
+    suivent sa configuration (propagation inchangée).
+    """
+    global _log_listener, _log_handler
+    if _log_listener is not None or logging.getLogger().handlers:
+        return
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _log_handler = QueueHandler(log_queue)
+    logger.addHandler(_log_handler)
+    _log_listener = QueueListener(log_queue, logging.StreamHandler())
+    _log_listener.start()
+
+
+def _stop_log_listener() -> None:
+    """Vide la file de logs et retire le handler posé par _start_log_listener."""
+    global _log_listener, _log_handler
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    logger.removeHandler(_log_handler)
+    _log_listener = _log_handler = None
 
 # DPI aware
 try:
-    import ctypes
     ctypes.windll.user32.SetProcessDPIAware()
 except Exception:
     pass
@@ -32,8 +74,6 @@ except Exception:
 # Import de la reconnaissance
 try:
     from poker_assistant.ocr.recognition_integration import RecognitionIntegration
-    import cv2
-    import numpy as np
     RECOGNITION_AVAILABLE = True
 except ImportError:
     RECOGNITION_AVAILABLE = False
@@ -56,10 +96,25 @@ except Exception:
     TextRecognitionPipeline = None  # type: ignore
     TEXT_OCR_AVAILABLE = False
 
+mss = None  # capture écran rapide ; importé à l'ouverture de l'aperçu (_import_mss)
+
+
+def _import_mss():
+    """Import paresseux de mss (sonde des écrans à l'import) : le module reste léger à charger."""
+    global mss
+    if mss is None:
+        try:
+            import mss as _mss
+        except ImportError:
+            return None
+        mss = _mss
+    return mss
+
+
 try:
-    import mss  # capture écran rapide
+    import cv2  # redimensionnement SIMD de l'aperçu
 except ImportError:
-    mss = None
+    cv2 = None
 
 
 def build_state_from_outputs(ocr_results: Dict[str, Any], cards: Dict[str, Any], bb_value: float) -> Optional[HandState]:
@@ -112,19 +167,18 @@ def build_state_from_outputs(ocr_results: Dict[str, Any], cards: Dict[str, Any],
 
 # Win32
 try:
-    import win32gui, win32ui, win32con
+    import win32gui, win32con
 except Exception:
     win32gui = None
-    win32ui = None
     win32con = None
 
-import yaml
-
 # projet
 try:
     from ..windows.detector import CandidateWindow
+    from ..config import load_yaml_cached
 except Exception:
     from windows.detector import CandidateWindow  # fallback exécution directe
+    from config import load_yaml_cached
 
 
 # ------------------------- utilitaires fenêtre -------------------------
@@ -147,9 +201,109 @@ def _get_client_rect_from_hwnd(hwnd: int) -> Optional[Tuple[int, int, int, int]]
         return None
 
 
-def _printwindow_client(hwnd: int) -> Optional[Image.Image]:
-    """Essaye de capturer la zone client via PrintWindow (anti-occlusion)."""
-    if not (win32gui and win32ui):
+class _BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ("biSize", ctypes.c_uint32), ("biWidth", ctypes.c_int32), ("biHeight", ctypes.c_int32),
+        ("biPlanes", ctypes.c_uint16), ("biBitCount", ctypes.c_uint16), ("biCompression", ctypes.c_uint32),
+        ("biSizeImage", ctypes.c_uint32), ("biXPelsPerMeter", ctypes.c_int32), ("biYPelsPerMeter", ctypes.c_int32),
+        ("biClrUsed", ctypes.c_uint32), ("biClrImportant", ctypes.c_uint32),
+    ]
+
+
+_GDI_API: Optional[Tuple[Any, Any]] = None
+
+
+def _gdi_api() -> Optional[Tuple[Any, Any]]:
+    """(user32, gdi32) via ctypes, prototypes typés (handles 64 bits) ; None hors Windows."""
+    global _GDI_API
+    if _GDI_API is None:
+        try:
+            from ctypes import wintypes
+            user32, gdi32 = ctypes.WinDLL("user32"), ctypes.WinDLL("gdi32")
+        except (AttributeError, OSError, ImportError):
+            return None
+        user32.GetWindowDC.argtypes = [wintypes.HWND]
+        user32.GetWindowDC.restype = wintypes.HDC
+        user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+        user32.PrintWindow.argtypes = [wintypes.HWND, wintypes.HDC, wintypes.UINT]
+        user32.PrintWindow.restype = wintypes.BOOL
+        gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+        gdi32.CreateCompatibleDC.restype = wintypes.HDC
+        gdi32.CreateDIBSection.argtypes = [wintypes.HDC, ctypes.c_void_p, wintypes.UINT,
+                                           ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD]
+        gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+        gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+        gdi32.SelectObject.restype = wintypes.HGDIOBJ
+        gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+        gdi32.DeleteDC.argtypes = [wintypes.HDC]
+        _GDI_API = (user32, gdi32)
+    return _GDI_API
+
+
+class _GdiCapture:
+    """DC mémoire + DIB section 32 bits de PrintWindow, conservés tant que (hwnd, W, H) ne change pas.
+
+    Appels GDI directs via ctypes : PrintWindow écrit dans la DIB section, dont les pixels
+    (BGRX, de haut en bas) sont lus par pointeur, sans GetBitmapBits.
+    Partagé entre le thread de capture et le thread Tk : toute utilisation passe par `lock`.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.key: Optional[Tuple[int, int, int]] = None
+        self.hwndDC = self.memDC = self.dib = self.old_obj = None
+        self.bits: Optional[int] = None  # adresse des pixels de la DIB section
+
+    def acquire(self, hwnd: int, W: int, H: int):
+        """DC mémoire prêt pour PrintWindow ; recréé seulement si la fenêtre ou sa taille change."""
+        if self.key != (hwnd, W, H):
+            self.release()
+            user32, gdi32 = _gdi_api()
+            self.hwndDC = user32.GetWindowDC(hwnd)
+            self.memDC = gdi32.CreateCompatibleDC(self.hwndDC)
+            bmi = _BITMAPINFOHEADER(biSize=ctypes.sizeof(_BITMAPINFOHEADER), biWidth=W, biHeight=-H,  # H<0 : de haut en bas
+                                    biPlanes=1, biBitCount=32, biCompression=0)  # 0 = BI_RGB
+            bits = ctypes.c_void_p()
+            self.dib = gdi32.CreateDIBSection(self.memDC, ctypes.byref(bmi), 0, ctypes.byref(bits), None, 0)
+            self.key = (hwnd, W, H)  # release() libère aussi un état partiel
+            if not self.dib or not bits.value:
+                raise OSError("CreateDIBSection a échoué")
+            self.old_obj = gdi32.SelectObject(self.memDC, self.dib)
+            self.bits = bits.value
+        return self.memDC
+
+    def release(self):
+        if self.key is None:
+            return
+        hwnd = self.key[0]
+        try:
+            user32, gdi32 = _gdi_api()
+            if self.old_obj:
+                gdi32.SelectObject(self.memDC, self.old_obj)
+            if self.dib:
+                gdi32.DeleteObject(self.dib)
+            if self.memDC:
+                gdi32.DeleteDC(self.memDC)
+            if self.hwndDC:
+                user32.ReleaseDC(hwnd, self.hwndDC)
+        except Exception:
+            pass
+        self.key = None
+        self.hwndDC = self.memDC = self.dib = self.old_obj = None
+        self.bits = None
+
+    def close(self):
+        with self.lock:
+            self.release()
+
+
+def _printwindow_client(hwnd: int, gdi: Optional[_GdiCapture] = None) -> Optional[Tuple[bytes, Tuple[int, int]]]:
+    """Essaye de capturer la zone client via PrintWindow (anti-occlusion).
+
+    Retourne le buffer BGRA brut et sa taille (w, h) : aucune conversion couleur ici.
+    `gdi` : ressources GDI persistantes de l'appelant ; sans elles, créées et libérées à chaque appel.
+    """
+    if not (win32gui and _gdi_api()):
         return None
     try:
         rect = _get_client_rect_from_hwnd(hwnd)
@@ -157,24 +311,29 @@ def _printwindow_client(hwnd: int) -> Optional[Image.Image]:
             return None
         L, T, R, B = rect
         W, H = R - L, B - T
-        hwndDC = win32gui.GetWindowDC(hwnd)
-        mfcDC  = win32ui.CreateDCFromHandle(hwndDC)
-        saveDC = mfcDC.CreateCompatibleDC()
-        bmp    = win32ui.CreateBitmap()
-        bmp.CreateCompatibleBitmap(mfcDC, W, H)
-        saveDC.SelectObject(bmp)
-        ok = win32gui.PrintWindow(hwnd, saveDC.GetSafeHdc(), 2)  # 2=PW_RENDERFULLCONTENT
-        bmpinfo = bmp.GetInfo()
-        bmpstr  = bmp.GetBitmapBits(True)
-        img = Image.frombuffer("RGB", (bmpinfo["bmWidth"], bmpinfo["bmHeight"]), bmpstr, "raw", "BGRX", 0, 1)
-        # cleanup
-        win32gui.DeleteObject(bmp.GetHandle())
-        saveDC.DeleteDC()
-        mfcDC.DeleteDC()
-        win32gui.ReleaseDC(hwnd, hwndDC)
-        return img if ok == 1 else None
+        if W <= 0 or H <= 0:
+            return None
     except Exception:
         return None
+    own = gdi is None
+    if own:
+        gdi = _GdiCapture()
+    with gdi.lock:
+        try:
+            user32, gdi32 = _gdi_api()
+            memDC = gdi.acquire(hwnd, W, H)
+            ok = user32.PrintWindow(hwnd, memDC, 2)  # 2=PW_RENDERFULLCONTENT
+            if not ok:
+                return None
+            gdi32.GdiFlush()
+            # Copie unique vers un buffer propre à la frame : la DIB section est réécrite à la capture suivante
+            return ctypes.string_at(gdi.bits, W * H * 4), (W, H)
+        except Exception:
+            gdi.release()
+            return None
+        finally:
+            if own:
+                gdi.release()
 
 
 def _ensure_target_visible(hwnd: int):
@@ -197,19 +356,86 @@ def _ensure_target_visible(hwnd: int):
         pass
 
 
-def _capture_bbox(bbox: Tuple[int, int, int, int]) -> Optional[Image.Image]:
+def _capture_bbox(bbox: Tuple[int, int, int, int], sct=None) -> Optional[Tuple[bytes, Tuple[int, int]]]:
+    """Capture écran de la bbox ; retourne (buffer BGRA, (w, h)) comme PrintWindow.
+
+    `sct` : session mss persistante de l'appelant (évite de recréer DC/handles à chaque frame).
+    """
     L, T, R, B = map(int, bbox)
     W, H = max(1, R - L), max(1, B - T)
+    monitor = {"left": L, "top": T, "width": W, "height": H}
     try:
+        if sct is not None:
+            raw = sct.grab(monitor)
+            return raw.bgra, raw.size
         if mss:
             with mss.mss() as sct:
-                raw = sct.grab({"left": L, "top": T, "width": W, "height": H})
-                return Image.frombytes("RGB", raw.size, raw.bgra, "raw", "BGRX")
-        return ImageGrab.grab(bbox=(L, T, R, B)).convert("RGB")
+                raw = sct.grab(monitor)
+                return raw.bgra, raw.size
+        from PIL import ImageGrab  # repli rare : importé à la demande
+        img = ImageGrab.grab(bbox=(L, T, R, B))
+        return img.tobytes("raw", "BGRX"), img.size
     except Exception:
         return None
 
 
+def _bgra_array(buf: bytes, size: Tuple[int, int]) -> np.ndarray:
+    """Vue numpy (H, W, 4) BGRA sur un buffer capturé, sans copie ni conversion."""
+    w, h = size
+    return np.frombuffer(buf, dtype=np.uint8).reshape(h, w, 4)
+
+
+# Granularité (px) des zones modifiées renvoyées à Tk entre deux frames de l'aperçu
+_DIRTY_TILE = 64
+
+
+def _frame_fingerprint(arr: np.ndarray) -> int:
+    """Empreinte de la frame entière (un texte de quelques pixels doit la faire changer)."""
+    data = arr.data if arr.flags.c_contiguous else arr.tobytes()
+    return hash((arr.shape, zlib.crc32(data)))
+
+
+# Les templates/crops exportés sont des artefacts intermédiaires (renommés puis rechargés) :
+# le taux de compression importe peu, deflate niveau 1 est bien plus rapide que le défaut (6).
+# Le format reste du PNG sans perte : CardRecognitionPipeline._load_templates ne charge que
+# "*.png", et un encodage JPEG introduirait des artefacts dans les templates de matching.
+_PNG_COMPRESS_LEVEL = 1
+
+
+def _save_images_parallel(tasks: List[Tuple[str, np.ndarray]]) -> List[bool]:
+    """Écrit les crops RGB (H, W, 3) en PNG en parallèle (l'encodeur Pillow libère le GIL pendant zlib).
+
+    Retourne, dans l'ordre des tâches, True si le fichier a été écrit.
+    """
+    def _save(task: Tuple[str, np.ndarray]) -> bool:
+        path, arr = task
+        try:
+            Image.fromarray(arr).save(path, "PNG", compress_level=_PNG_COMPRESS_LEVEL, optimize=False)
+            return True
+        except Exception as e:
+            logger.warning("Erreur écriture %s: %s", path, e)
+            return False
+
+    if not tasks:
+        return []
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+        return list(pool.map(_save, tasks))
+
+
+@dataclass(slots=True)
+class CardExportPlan:
+    """Zones rank/suit d'une carte, extraites une fois du YAML pour l'export des templates."""
+    card_name: str
+    card_roi: Dict[str, float]  # ROI de la carte dans le layout (normalisée)
+    zone_names: List[str]
+    zone_types: List[str]
+    zones_xyxy: np.ndarray  # (N, 4) x0, y0, x1, y1 normalisés dans la carte
+
+
+# Noms de ROI considérés comme des cartes (board_card1, hero_cards_left, tout nom avec "card")
+_CARD_NAME_RE = re.compile(r'board_card\d+|hero_cards_(?:left|right)|card', re.IGNORECASE)
+
+
 # ------------------------- classe principale -------------------------
 
 class LivePreview(tk.Tk):
@@ -229,8 +455,9 @@ class LivePreview(tk.Tk):
         fit_to_window: bool = True,
     ):
         super().__init__()
-        if mss is None:
+        if _import_mss() is None:
             raise RuntimeError("Le module 'mss' est requis. pip install mss pillow pywin32 pyyaml")
+        _start_log_listener()
 
         self.title(f"Aperçu: {candidate.title}")
         self.state("normal")  # s'assurer qu'on n'est pas coincé en plein écran
@@ -242,6 +469,9 @@ class LivePreview(tk.Tk):
         self.candidate = candidate
         self.track_move = track_move
         self.target_frame_time = 1.0 / max(1, int(target_fps))
+        # Cadence effective de l'aperçu (minimum 200ms entre les mises à jour pour éviter le
+        # clignotement) : partagée par le thread de capture et la boucle Tk, aucune frame jetée
+        self._frame_period = max(0.2, self.target_frame_time)
         self.scale = float(scale)
         self.anti_mirror = tk.BooleanVar(value=anti_mirror)
         self.fit_to_window = tk.BooleanVar(value=fit_to_window)
@@ -249,18 +479,69 @@ class LivePreview(tk.Tk):
         self._running = True
         self._photo = None
         self._last_raw_size: Optional[Tuple[int, int]] = None
-        self._last_raw: Optional[Image.Image] = None  # Stockage du dernier raw pour export instantané
+        # Dernière frame capturée : tableau BGRA (H, W, 4) de référence (export, OCR) ;
+        # l'image PIL n'est construite qu'à la demande pour l'aperçu Tk.
+        self._last_raw_np: Optional[np.ndarray] = None
+        self._last_raw_bgr: Optional[np.ndarray] = None  # vue BGR (H, W, 3) pour l'OCR / la reconnaissance
+        self._last_raw: Optional[Image.Image] = None
+        self._last_raw_ts = 0.0  # time.monotonic() de la dernière capture réussie
+        # Levé tant que la dernière capture a réussi (lecture sans verrou depuis n'importe quel thread)
+        self._last_raw_valid = threading.Event()
         self._sct = mss.mss() if mss else None
+        self._gdi = _GdiCapture()  # DC/bitmap PrintWindow réutilisés d'une frame à l'autre
+        # Thread de capture : dépose (frame BGRA, aperçu redimensionné, horodatage) dans
+        # _front_buf ; la boucle Tk ne fait que PhotoImage + canvas.
+        self._frame_lock = threading.Lock()
+        self._scratch_free: List[np.ndarray] = []  # buffers de resize réutilisables (sous _frame_lock)
+        self._front_buf: Optional[Tuple[np.ndarray, Optional[np.ndarray], float, int]] = None
+        self._frame_fp: Optional[int] = None  # empreinte de la frame courante (_frame_fingerprint)
+        self._frame_dirty = False  # la dernière frame stockée diffère de la précédente
+        self._disp_size: Optional[Tuple[int, int]] = None  # taille d'affichage voulue (publiée par la boucle Tk)
+        self._sync_capture = False  # anti-miroir actif : la capture repasse sur le thread Tk
+        self._capture_stop = threading.Event()
+        self._capture_thread = threading.Thread(target=self._capture_worker, name="live-preview-capture", daemon=True)
 
         # offsets de centrage dans le canvas
         self._offset_x = 0
         self._offset_y = 0
+        self._redraw_after_id: Optional[str] = None  # redraw différé (<Configure> regroupés)
+        self._next_deadline: Optional[float] = None  # échéance perf_counter() du prochain tick de _loop
+        # Items canvas réutilisés d'une frame à l'autre (coords/itemconfigure plutôt que delete+create)
+        self._image_id: Optional[int] = None
+        self._last_image_key: Optional[tuple] = None  # (empreinte frame, disp_w, disp_h) affichée
+        self._shown_bgra: Optional[np.ndarray] = None  # BGRA affiché, référence des zones modifiées
+        self._shown_scratch = False  # _shown_bgra appartient au pool de resize (_scratch_free)
+        self._overlay_items: Dict[tuple, int] = {}
+        self._overlay_seen: set = set()
 
         # Configuration YAML
         self.cfg: Dict[str, Any] = {}
         self.yaml_path = yaml_path
         self.layout_var = tk.StringVar(value=layout)
         self.relative_to_var = tk.StringVar(value="client")
+        # Cache des ROIs de cartes en pixels (invalidé au changement de YAML/layout/base)
+        self._card_rois_cache: Optional[Dict[str, Tuple[int, int, int, int]]] = None
+        self._card_rois_cache_key: tuple = ()
+        # Rectangles d'overlay des ROIs en pixels d'affichage (clé : YAML, layout, base, taille)
+        self._roi_rects_cache: Optional[List[Tuple[str, int, int, int, int]]] = None
+        self._roi_rects_key: tuple = ()
+        # ROIs du layout en colonnes (noms + x/y/w/h) pour le calcul vectorisé des rectangles
+        self._roi_arrays_cache: Optional[Tuple[List[str], np.ndarray]] = None
+        self._roi_arrays_key: tuple = ()
+        # anchors.table_zone normalisée (x, y, w, h) pour le YAML/layout courant
+        self._anchor_norm: Optional[Tuple[float, float, float, float]] = None
+        self._anchor_norm_key: tuple = ()
+        # Plan d'export des templates (card_zones aplaties) pour le YAML/layout courant
+        self._export_plan: Optional[List[CardExportPlan]] = None
+        self._export_plan_key: tuple = ()
+        # Dossiers d'export déjà créés pendant la session (évite les makedirs répétés)
+        self._created_dirs: set[str] = set()
+        # Prochain numéro de template par (dossier, préfixe), lu sur disque au premier export
+        self._template_counters: Dict[Tuple[str, str], int] = {}
+        # Fin des exports en arrière-plan : callbacks déposés par les threads, exécutés par
+        # _drain_ui_calls sur le thread Tk (aucun appel Tk hors de ce thread)
+        self._ui_calls: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+        self._pending_saves = 0
 
         # Intégration de la reconnaissance
         self.recognition_integration: Optional[RecognitionIntegration] = None
@@ -293,6 +574,7 @@ class LivePreview(tk.Tk):
         self.bind("<Configure>", lambda e: self._request_redraw())
 
         # boucle
+        self._capture_thread.start()
         self.after(0, self._loop)
 
     # ------------------------- UI -------------------------
@@ -306,23 +588,23 @@ class LivePreview(tk.Tk):
         self.layout_box = ttk.Combobox(top, width=14, textvariable=self.layout_var, state="readonly")
         self.layout_box.pack(side="left")
         self._refresh_layout_choices()
-        self.layout_box.bind("<<ComboboxSelected>>", lambda e: self._request_redraw())
+        self.layout_box.bind("<<ComboboxSelected>>", lambda e: self._on_roi_config_change())
 
         ttk.Label(top, text="Base:").pack(side="left", padx=(8, 2))
         base_box = ttk.Combobox(top, width=12, values=["client", "table_zone"], textvariable=self.relative_to_var, state="readonly")
         base_box.pack(side="left")
-        self.relative_to_var.trace("w", lambda *args: self._request_redraw())
+        self.relative_to_var.trace("w", lambda *args: self._on_roi_config_change())
 
         self.show_rectangles = tk.BooleanVar(value=True)
         self.show_labels = tk.BooleanVar(value=True)
         self.show_table_zone = tk.BooleanVar(value=True)
         self.show_card_zones = tk.BooleanVar(value=True)
-        ttk.Checkbutton(top, text="Rectangles", variable=self.show_rectangles, command=self._request_redraw).pack(side="left", padx=(8, 2))
-        ttk.Checkbutton(top, text="Noms", variable=self.show_labels, command=self._request_redraw).pack(side="left", padx=(4, 2))
-        ttk.Checkbutton(top, text="Afficher table_zone", variable=self.show_table_zone, command=self._request_redraw).pack(side="left", padx=(4, 2))
-        ttk.Checkbutton(top, text="Zones Cartes", variable=self.show_card_zones, command=self._request_redraw).pack(side="left", padx=(4, 2))
+        ttk.Checkbutton(top, text="Rectangles", variable=self.show_rectangles, command=self._on_overlay_toggle).pack(side="left", padx=(8, 2))
+        ttk.Checkbutton(top, text="Noms", variable=self.show_labels, command=self._on_overlay_toggle).pack(side="left", padx=(4, 2))
+        ttk.Checkbutton(top, text="Afficher table_zone", variable=self.show_table_zone, command=self._on_overlay_toggle).pack(side="left", padx=(4, 2))
+        ttk.Checkbutton(top, text="Zones Cartes", variable=self.show_card_zones, command=self._on_overlay_toggle).pack(side="left", padx=(4, 2))
         self.show_text_zones = tk.BooleanVar(value=True)
-        ttk.Checkbutton(top, text="Zones OCR", variable=self.show_text_zones, command=self._request_redraw).pack(side="left", padx=(4, 2))
+        ttk.Checkbutton(top, text="Zones OCR", variable=self.show_text_zones, command=self._on_overlay_toggle).pack(side="left", padx=(4, 2))
         ttk.Checkbutton(top, text="Anti-miroir", variable=self.anti_mirror).pack(side="left", padx=(8, 2))
         ttk.Checkbutton(top, text="Fit à la fenêtre", variable=self.fit_to_window, command=self._request_redraw).pack(side="left", padx=(8, 2))
 
@@ -352,6 +634,9 @@ class LivePreview(tk.Tk):
 
         self.canvas = tk.Canvas(self, bd=0, highlightthickness=0, bg="#0f0f10")
         self.canvas.pack(fill="both", expand=True)
+        # Taille du canvas tenue à jour par Tk : la boucle la lit sans passe de layout forcée
+        self._canvas_size = (1, 1)
+        self.canvas.bind("<Configure>", lambda e: setattr(self, "_canvas_size", (max(1, e.width), max(1, e.height))))
 
         self.bind("<Escape>", lambda e: self._on_close())
         self.protocol("WM_DELETE_WINDOW", self._on_close)
@@ -363,11 +648,11 @@ class LivePreview(tk.Tk):
 
     def _load_yaml(self, path: str):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                self.cfg = yaml.safe_load(f) or {}
+            # Même cache que config (chemin, mtime) : un YAML inchangé n'est pas reparsé
+            self.cfg = load_yaml_cached(Path(path).resolve())
             self.yaml_path = path
             self._refresh_layout_choices()
-            self._request_redraw()
+            self._on_roi_config_change()
         except Exception as e:
             messagebox.showerror("YAML", f"Erreur d'ouverture YAML :\n{e}")
 
@@ -384,6 +669,17 @@ class LivePreview(tk.Tk):
         if self.layout_var.get() not in layouts:
             self.layout_var.set(layouts[0])
 
+    def _on_roi_config_change(self):
+        """YAML, layout ou base modifié : les conversions ROI→pixels sont à refaire."""
+        self._card_rois_cache = None
+        self._roi_rects_cache = None
+        self._roi_arrays_cache = None
+        self._anchor_norm = None
+        self._export_plan = None
+        # Les libellés (types de zones...) peuvent changer avec le YAML : items recréés
+        self._clear_overlays()
+        self._request_redraw()
+
     def _on_zoom_change(self, value):
         self.scale = float(value)
         if self.fit_to_window.get():
@@ -427,7 +723,6 @@ class LivePreview(tk.Tk):
 
     def _intersects_preview(self, bbox: Tuple[int, int, int, int]) -> bool:
         try:
-            self.update_idletasks()
             gx, gy = self.winfo_rootx(), self.winfo_rooty()
             gw, gh = max(1, self.winfo_width()), max(1, self.winfo_height())
             L, T, R, B = bbox
@@ -435,18 +730,24 @@ class LivePreview(tk.Tk):
         except Exception:
             return False
 
-    def _capture_raw(self) -> Optional[Image.Image]:
+    def _capture_raw(self) -> Optional[np.ndarray]:
+        """Capture synchrone (thread Tk) d'une frame BGRA (H, W, 4) ; None si la capture échoue."""
+        frame = self._grab_frame()
+        if frame is None:
+            self._last_raw_valid.clear()
+            return None
+        return self._store_frame(_bgra_array(*frame), time.monotonic())
+
+    def _grab_frame(self) -> Optional[Tuple[bytes, Tuple[int, int]]]:
         try:
             bbox = self._current_bbox()
             if not bbox or bbox[2] <= bbox[0] or bbox[3] <= bbox[1]:
                 return None
 
             # 1) PrintWindow si possible (anti-occlusion/mirror)
-            if self.candidate.handle:
-                img = _printwindow_client(self.candidate.handle)
-                if img is not None and img.size[0] > 0 and img.size[1] > 0:
-                    self._last_raw = img  # Stocke pour l'export
-                    return img
+            frame = self._grab_printwindow()
+            if frame is not None:
+                return frame
 
             # 2) Screen crop (avec anti-miroir optionnel)
             withdraw = False
@@ -456,14 +757,7 @@ class LivePreview(tk.Tk):
                 except Exception:
                     pass
             try:
-                if self.candidate.handle:
-                    _ensure_target_visible(self.candidate.handle)
-                    time.sleep(0.1)  # Délai augmenté pour la stabilisation
-                img = _capture_bbox(bbox)
-                if img is not None and img.size[0] > 0 and img.size[1] > 0:
-                    self._last_raw = img  # Stocke pour l'export
-                    return img
-                return None
+                return self._grab_screen(bbox, self._sct)
             finally:
                 if withdraw:
                     try:
@@ -474,9 +768,133 @@ class LivePreview(tk.Tk):
             print(f"Debug: Erreur capture: {e}")
             return None
 
+    def _grab_printwindow(self) -> Optional[Tuple[bytes, Tuple[int, int]]]:
+        if self.candidate.handle:
+            frame = _printwindow_client(self.candidate.handle, self._gdi)
+            if frame is not None and frame[1][0] > 0 and frame[1][1] > 0:
+                return frame
+        return None
+
+    def _grab_screen(self, bbox: Tuple[int, int, int, int], sct) -> Optional[Tuple[bytes, Tuple[int, int]]]:
+        hwnd = self.candidate.handle
+        if hwnd and win32gui and win32gui.GetForegroundWindow() != hwnd:
+            # Attente de stabilisation seulement quand la table vient d'être ramenée au premier plan
+            _ensure_target_visible(hwnd)
+            time.sleep(0.1)
+        frame = _capture_bbox(bbox, sct)
+        if frame is not None and frame[1][0] > 0 and frame[1][1] > 0:
+            return frame
+        return None
+
+    def _capture_worker(self):
+        """Boucle du thread de capture (PrintWindow / screen crop + resize), hors du thread Tk.
+
+        Sans appel Tk : quand l'anti-miroir doit masquer l'aperçu, la boucle Tk reprend la
+        capture en synchrone (_sync_capture) et ce thread se met en attente.
+        """
+        sct = mss.mss() if mss else None  # session mss propre à ce thread
+        failures = 0
+        last_fp = None
+        try:
+            while not self._capture_stop.is_set():
+                t0 = time.monotonic()
+                if not self._sync_capture:
+                    frame = None
+                    try:
+                        bbox = self._current_bbox()
+                        if bbox and bbox[2] > bbox[0] and bbox[3] > bbox[1]:
+                            frame = self._grab_printwindow() or self._grab_screen(bbox, sct)
+                    except Exception as e:
+                        print(f"Debug: Erreur capture: {e}")
+                    if frame is not None:
+                        failures = 0
+                        arr = _bgra_array(*frame)
+                        fp = _frame_fingerprint(arr)
+                        small = None
+                        disp = self._disp_size
+                        # Table inchangée : pas de resize (la boucle Tk ne redessinera pas non plus)
+                        if fp != last_fp and cv2 is not None and disp and disp != (arr.shape[1], arr.shape[0]):
+                            small = cv2.resize(arr, disp, dst=self._take_scratch(disp), interpolation=cv2.INTER_AREA)
+                        last_fp = fp
+                        with self._frame_lock:
+                            old, self._front_buf = self._front_buf, (arr, small, t0, fp)
+                        if old is not None:
+                            self._recycle_scratch(old[1])  # frame jamais affichée
+                    else:
+                        failures += 1
+                        self._last_raw_valid.clear()
+
+                # Échecs consécutifs : pause plus longue
+                if failures > 10:
+                    print(f"⚠️ {failures} échecs consécutifs - pause de 2 secondes")
+                    pause = 2.0
+                elif failures > 5:
+                    print(f"⚠️ {failures} échecs consécutifs - pause de 1 seconde")
+                    pause = 1.0
+                else:
+                    pause = max(0.0, self._frame_period - (time.monotonic() - t0))
+                self._capture_stop.wait(pause)
+        finally:
+            if sct:
+                sct.close()
+
+    def _next_frame(self) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """(frame BGRA, aperçu déjà redimensionné ou None) à afficher ; (None, None) si rien de neuf.
+
+        Reprend la frame du thread de capture, ou capture en synchrone quand l'aperçu
+        recouvre la table avec l'anti-miroir actif (masquage de la fenêtre côté Tk).
+        """
+        bbox = self._current_bbox()
+        self._sync_capture = bool(self.anti_mirror.get() and bbox and self._intersects_preview(bbox))
+        if self._sync_capture:
+            return self._capture_raw(), None
+        with self._frame_lock:
+            buf, self._front_buf = self._front_buf, None
+        if buf is None:
+            return None, None
+        arr, small, ts, fp = buf
+        return self._store_frame(arr, ts, fp), small
+
+    def _store_frame(self, arr: np.ndarray, ts: float, fp: Optional[int] = None) -> np.ndarray:
+        """Mémorise une frame BGRA (vue numpy sur le buffer capturé, aucune conversion ici).
+
+        Chaque capture crée un nouveau buffer, les appelants peuvent donc garder une frame
+        sans qu'elle soit modifiée ensuite. Appelé uniquement depuis le thread Tk.
+        """
+        if fp is None:
+            fp = _frame_fingerprint(arr)
+        self._frame_dirty = fp != self._frame_fp
+        self._frame_fp = fp
+        self._last_raw_np = arr
+        self._last_raw_bgr = arr[:, :, :3]
+        self._last_raw = None  # image Tk reconstruite à la demande
+        self._last_raw_ts = ts
+        self._last_raw_valid.set()
+        return arr
+
+    def _preview_image(self) -> Optional[Image.Image]:
+        """Image RGB de la dernière frame pour l'aperçu, décodée une seule fois par frame."""
+        if self._last_raw is None and self._last_raw_np is not None:
+            h, w = self._last_raw_np.shape[:2]
+            self._last_raw = Image.frombuffer("RGB", (w, h), self._last_raw_np, "raw", "BGRX", 0, 1)
+        return self._last_raw
+
+    def _ensure_recent_frame(self, max_age_s: float = 1.0) -> bool:
+        """Réutilise la frame de la boucle ; ne recapture que si elle manque ou est périmée."""
+        if not self._last_raw_valid.is_set() or time.monotonic() - self._last_raw_ts > max_age_s:
+            self._capture_raw()
+        return self._last_raw_valid.is_set()
+
     # ------------------------- overlay helpers -------------------------
     def _get_anchor_norm(self) -> Tuple[float, float, float, float]:
-        """anchors.table_zone si présent, sinon plein client (0,0,1,1)."""
+        """anchors.table_zone si présent, sinon plein client (0,0,1,1) ; mémorisé par YAML/layout."""
+        key = (id(self.cfg), self.layout_var.get())
+        if self._anchor_norm is None or self._anchor_norm_key != key:
+            self._anchor_norm = self._read_anchor_norm()
+            self._anchor_norm_key = key
+        return self._anchor_norm
+
+    def _read_anchor_norm(self) -> Tuple[float, float, float, float]:
         if not self.cfg:
             return 0.0, 0.0, 1.0, 1.0
         anchors = self.cfg.get("anchors") or {}
@@ -490,184 +908,368 @@ class LivePreview(tk.Tk):
             return float(tz.get("x", 0.0)), float(tz.get("y", 0.0)), float(tz.get("w", 1.0)), float(tz.get("h", 1.0))
         return 0.0, 0.0, 1.0, 1.0
 
-    def _iter_roi_rects(self, disp_w: int, disp_h: int):
-        if not self.cfg:
-            return
-        layout = (self.cfg.get("layouts") or {}).get(self.layout_var.get(), {}) or {}
-        rois: Dict[str, Dict[str, float]] = layout.get("rois") or {}
-        if not rois:
-            return
-
-        base = self.relative_to_var.get()
-        ax, ay, aw, ah = self._get_anchor_norm()
-
-        # Taille de référence (si jamais quelqu'un a besoin d'un ref size)
-        ref_size = self.cfg.get("client_size", {}) or {}
-        ref_w = float(ref_size.get("w", disp_w))
-        ref_h = float(ref_size.get("h", disp_h))
-        scale_x = disp_w / ref_w if ref_w > 0 else 1.0
-        scale_y = disp_h / ref_h if ref_h > 0 else 1.0
-
-        for name, r in rois.items():
-            if name == "table_zone":
-                continue
-            try:
-                x = float(r["x"]); y = float(r["y"]); w = float(r["w"]); h = float(r["h"])
-            except Exception:
-                continue
-
-            if base == "table_zone":
-                x0 = round((ax + x * aw) * disp_w)
-                y0 = round((ay + y * ah) * disp_h)
-                x1 = round((ax + (x + w) * aw) * disp_w)
-                y1 = round((ay + (y + h) * ah) * disp_h)
-            else:  # client
-                x0 = round(x * ref_w * scale_x)
-                y0 = round(y * ref_h * scale_y)
-                x1 = round((x + w) * ref_w * scale_x)
-                y1 = round((y + h) * ref_h * scale_y)
-            yield name, x0, y0, x1, y1
+    def _iter_roi_rects(self, disp_w: int, disp_h: int) -> List[Tuple[str, int, int, int, int]]:
+        """Rectangles (name, x0, y0, x1, y1) des ROIs en pixels d'affichage, recalculés
+        seulement si le YAML, le layout, la base ou la taille d'affichage changent."""
+        key = (id(self.cfg), self.layout_var.get(), self.relative_to_var.get(), disp_w, disp_h)
+        if self._roi_rects_cache is None or self._roi_rects_key != key:
+            self._roi_rects_cache = self._compute_roi_rects(disp_w, disp_h)
+            self._roi_rects_key = key
+        return self._roi_rects_cache
+
+    def _roi_arrays(self) -> Tuple[List[str], np.ndarray]:
+        """ROIs du layout courant en colonnes : noms + tableau (N, 4) x, y, w, h normalisés.
+
+        Construit une fois par YAML/layout ; les ROIs mal formées sont ignorées.
+        """
+        key = (id(self.cfg), self.layout_var.get())
+        if self._roi_arrays_cache is None or self._roi_arrays_key != key:
+            names: List[str] = []
+            values: List[Tuple[float, float, float, float]] = []
+            layout = ((self.cfg or {}).get("layouts") or {}).get(self.layout_var.get(), {}) or {}
+            rois: Dict[str, Dict[str, float]] = layout.get("rois") or {}
+            for name, r in rois.items():
+                if name == "table_zone":
+                    continue
+                try:
+                    values.append((float(r["x"]), float(r["y"]), float(r["w"]), float(r["h"])))
+                except Exception:
+                    continue
+                names.append(name)
+            self._roi_arrays_cache = (names, np.array(values, dtype=np.float64).reshape(-1, 4))
+            self._roi_arrays_key = key
+        return self._roi_arrays_cache
+
+    def _compute_roi_rects(self, disp_w: int, disp_h: int) -> List[Tuple[str, int, int, int, int]]:
+        names, xywh = self._roi_arrays()
+        if not names:
+            return []
+        x, y, w, h = xywh.T
+
+        if self.relative_to_var.get() == "table_zone":
+            ax, ay, aw, ah = self._get_anchor_norm()
+            x0 = (ax + x * aw) * disp_w
+            y0 = (ay + y * ah) * disp_h
+            x1 = (ax + (x + w) * aw) * disp_w
+            y1 = (ay + (y + h) * ah) * disp_h
+        else:  # client
+            # Taille de référence (si jamais quelqu'un a besoin d'un ref size)
+            ref_size = self.cfg.get("client_size", {}) or {}
+            ref_w = float(ref_size.get("w", disp_w))
+            ref_h = float(ref_size.get("h", disp_h))
+            scale_x = disp_w / ref_w if ref_w > 0 else 1.0
+            scale_y = disp_h / ref_h if ref_h > 0 else 1.0
+            x0 = x * ref_w * scale_x
+            y0 = y * ref_h * scale_y
+            x1 = (x + w) * ref_w * scale_x
+            y1 = (y + h) * ref_h * scale_y
+
+        # np.round arrondit au pair comme round() : mêmes pixels que le calcul ROI par ROI ;
+        # les coins sont ensuite bornés à l'image affichée (pas de rectangle hors aperçu)
+        rects = np.round(np.stack((x0, y0, x1, y1), axis=1)).astype(np.int64)
+        rects = np.clip(rects, 0, (disp_w - 1, disp_h - 1, disp_w - 1, disp_h - 1)).tolist()
+        return [(name, *rect) for name, rect in zip(names, rects, strict=True)]
 
     # ------------------------- boucle -------------------------
     def _loop(self):
         if not self._running:
             return
 
-        # Contrôle de fréquence pour éviter le clignotement
-        current_time = time.time()
-        if hasattr(self, '_last_update_time'):
-            time_since_last = current_time - self._last_update_time
-            if time_since_last < 0.2:  # Minimum 200ms entre les mises à jour
-                self.after(100, self._loop)
-                return
-        
-        self._last_update_time = current_time
-        t0 = time.time()
+        # Cadence fixe (voir _frame_period)
+        period = self._frame_period
+        if self._next_deadline is None:
+            self._next_deadline = time.perf_counter()
 
         # Compteur d'échecs consécutifs
         if not hasattr(self, '_consecutive_failures'):
             self._consecutive_failures = 0
 
-        raw = self._capture_raw()
-        if raw is not None and raw.size[0] > 0 and raw.size[1] > 0:
+        frame, small = self._next_frame()
+        if frame is not None and frame.shape[0] > 0 and frame.shape[1] > 0:
             # Reset du compteur d'échecs en cas de succès
             self._consecutive_failures = 0
-            self._last_raw_size = raw.size
-            W, H = raw.size
+            H, W = frame.shape[:2]
+            self._last_raw_size = (W, H)
             
             # Intégration de la reconnaissance
             if self.recognition_integration and self.recognition_integration.recognition_enabled:
-                # Convertit l'image PIL en numpy array pour OpenCV
-                frame_array = np.array(raw)
-                frame_bgr = cv2.cvtColor(frame_array, cv2.COLOR_RGB2BGR)
-                
-                # Envoie le frame au pipeline de reconnaissance
-                self.recognition_integration.process_frame(frame_bgr)
+                # Envoie directement la vue BGR capturée (pas de reconversion RGB→BGR)
+                self.recognition_integration.process_frame(self._last_raw_bgr)
                 
                 # Met à jour l'affichage de la reconnaissance
                 self._update_recognition_display()
 
-            # Choisir l'échelle effective
-            eff_scale = self.scale
-            self.update_idletasks()
-            cw = max(1, self.canvas.winfo_width())
-            ch = max(1, self.canvas.winfo_height())
-            if self.fit_to_window.get():
-                eff_scale = max(0.1, min(cw / W, ch / H))
-                self.scale_var.set(eff_scale)
-
-            disp_w, disp_h = int(W * eff_scale), int(H * eff_scale)
-            img = raw if eff_scale == 1.0 else raw.resize((disp_w, disp_h), Image.NEAREST)
-
-            # Centrage dans le canvas
-            new_offset_x = max(0, (cw - disp_w) // 2)
-            new_offset_y = max(0, (ch - disp_h) // 2)
-            
-            # Vérifie si l'image ou la position ont changé pour éviter les redraws inutiles
-            image_changed = (not hasattr(self, '_last_image_hash') or 
-                           hash(img.tobytes()) != self._last_image_hash)
-            position_changed = (not hasattr(self, '_offset_x') or 
-                              self._offset_x != new_offset_x or 
-                              self._offset_y != new_offset_y)
-            
-            if image_changed or position_changed:
-                self._offset_x = new_offset_x
-                self._offset_y = new_offset_y
-                self._last_image_hash = hash(img.tobytes())
-                
-                self._photo = ImageTk.PhotoImage(img)
-                self.canvas.delete("all")
-                self.canvas.create_image(self._offset_x, self._offset_y, image=self._photo, anchor=tk.NW)
-                self.canvas.config(scrollregion=(0, 0, max(cw, disp_w), max(ch, disp_h)))
-
-            # Dessiner overlays (toujours mis à jour)
-            self._draw_overlays(disp_w, disp_h, raw, eff_scale)
+            if self._frame_dirty:
+                self._render_frame(frame, small)
 
-            # FPS
-            self._update_fps()
-        else:
-            # Échec de capture - incrémente le compteur
+                # FPS
+                self._update_fps()
+            else:
+                # Table inchangée depuis la dernière frame : seul le redraw est évité
+                self._recycle_scratch(small)
+        elif self._sync_capture:
+            # Échec de capture synchrone - incrémente le compteur (le thread de capture gère les siens)
             self._consecutive_failures += 1
             
             # Si trop d'échecs consécutifs, pause plus longue
             if self._consecutive_failures > 10:
                 print(f"⚠️ {self._consecutive_failures} échecs consécutifs - pause de 2 secondes")
+                self._next_deadline = None  # repartir d'une échéance neuve après la pause
                 self.after(2000, self._loop)  # Pause de 2 secondes
                 return
             elif self._consecutive_failures > 5:
                 print(f"⚠️ {self._consecutive_failures} échecs consécutifs - pause de 1 seconde")
+                self._next_deadline = None
                 self.after(1000, self._loop)  # Pause de 1 seconde
                 return
 
-        # cadence - délai minimum augmenté pour éviter le clignotement
-        elapsed = time.time() - t0
-        delay = max(200, int((self.target_frame_time - elapsed) * 1000))  # Minimum 200ms
+        # Échéance suivante calée sur la période (pas de dérive) ; en retard de plus
+        # d'une période, on saute les ticks manqués au lieu de rattraper en rafale.
+        now = time.perf_counter()
+        self._next_deadline += period
+        if now - self._next_deadline > period:
+            self._next_deadline = now + period
+        delay = max(1, int((self._next_deadline - now) * 1000))
         self.after(delay, self._loop)
 
-    def _draw_overlays(self, disp_w: int, disp_h: int, raw_img: Image.Image, eff_scale: float):
+    def _render_frame(self, frame: np.ndarray, small: Optional[np.ndarray]):
+        """Affiche une frame BGRA (redimensionnement, centrage) et redessine les overlays."""
+        H, W = frame.shape[:2]
+        # Choisir l'échelle effective
+        eff_scale = self.scale
+        cw, ch = self._canvas_size
+        if self.fit_to_window.get():
+            eff_scale = max(0.1, min(cw / W, ch / H))
+            self.scale_var.set(eff_scale)
+
+        disp_w, disp_h = int(W * eff_scale), int(H * eff_scale)
+        self._disp_size = (disp_w, disp_h)
+        # Centrage dans le canvas
+        new_offset_x = max(0, (cw - disp_w) // 2)
+        new_offset_y = max(0, (ch - disp_h) // 2)
+
+        # Image reconstruite seulement si la frame (empreinte) ou la taille d'affichage ont changé
+        image_key = (self._frame_fp, disp_w, disp_h)
+        raw = None
+        if image_key != self._last_image_key:
+            shown: Optional[np.ndarray] = None  # BGRA (disp_h, disp_w, 4) affiché, si disponible
+            shown_scratch = False  # shown vient du pool de buffers de resize
+            img: Optional[Image.Image] = None
+            if small is not None and small.shape[:2] == (disp_h, disp_w):
+                shown, small, shown_scratch = small, None, True  # déjà redimensionnée par le thread de capture
+            elif eff_scale == 1.0:
+                shown = frame
+            elif cv2 is not None:
+                # Redimensionne directement le buffer BGRA ; seule la petite image est décodée en RGB
+                shown = cv2.resize(frame, (disp_w, disp_h), dst=self._take_scratch((disp_w, disp_h)),
+                                   interpolation=cv2.INTER_AREA)
+                shown_scratch = True
+            else:
+                raw = self._preview_image()
+                img = raw.resize((disp_w, disp_h), Image.NEAREST)
+            same_size = self._photo is not None and (self._photo.width(), self._photo.height()) == (disp_w, disp_h)
+            dirty = self._dirty_box(shown) if same_size else None
+            if self._shown_scratch:
+                self._recycle_scratch(self._shown_bgra)
+            self._shown_bgra, self._shown_scratch = shown, shown_scratch
+            self._last_image_key = image_key
+            if dirty is not None:
+                # Seule la zone modifiée est envoyée à Tk (PPM + put -to)
+                x0, y0, x1, y1 = dirty
+                if x1 > x0 and y1 > y0:
+                    rgb = np.ascontiguousarray(shown[y0:y1, x0:x1, 2::-1])
+                    ppm = b"P6 %d %d 255\n" % (x1 - x0, y1 - y0) + rgb.tobytes()
+                    self.tk.call(str(self._photo), "put", ppm, "-format", "ppm", "-to", x0, y0)
+            elif same_size:
+                # Même taille : on réécrit les pixels de la photo Tk existante (pas de nouvelle image Tk)
+                self._photo.paste(img or self._shown_image(shown))
+            else:
+                img = img or self._shown_image(shown)
+                self._photo = ImageTk.PhotoImage(img)
+                if self._image_id is None:
+                    self._image_id = self.canvas.create_image(new_offset_x, new_offset_y, image=self._photo, anchor=tk.NW)
+                    self.canvas.tag_lower(self._image_id)
+                else:
+                    self.canvas.itemconfigure(self._image_id, image=self._photo)
+                self.canvas.config(scrollregion=(0, 0, max(cw, disp_w), max(ch, disp_h)))
+
+        self._recycle_scratch(small)  # resize du thread de capture non utilisé
+
+        if (new_offset_x, new_offset_y) != (self._offset_x, self._offset_y):
+            self._offset_x = new_offset_x
+            self._offset_y = new_offset_y
+            self.canvas.coords(self._image_id, self._offset_x, self._offset_y)
+            self.canvas.config(scrollregion=(0, 0, max(cw, disp_w), max(ch, disp_h)))
+
+        # Dessiner overlays (toujours mis à jour)
+        self._draw_overlays(disp_w, disp_h, raw, eff_scale)
+
+    def _take_scratch(self, size: Tuple[int, int]) -> Optional[np.ndarray]:
+        """Buffer BGRA (h, w, 4) recyclé pour la sortie de cv2.resize ; None → cv2 en alloue un.
+
+        Tant que la taille d'affichage ne change pas, les mêmes buffers tournent entre le
+        thread de capture et la boucle Tk (plus d'allocation de plusieurs Mo par frame).
+        """
+        w, h = size
+        with self._frame_lock:
+            while self._scratch_free:
+                buf = self._scratch_free.pop()
+                if buf.shape == (h, w, 4):
+                    return buf
+        return None
+
+    def _recycle_scratch(self, buf: Optional[np.ndarray]):
+        """Rend au pool un buffer de resize qui n'est plus référencé par l'affichage."""
+        if buf is not None:
+            with self._frame_lock:
+                self._scratch_free.append(buf)
+
+    def _shown_image(self, shown: np.ndarray) -> Image.Image:
+        if shown is self._last_raw_np:
+            return self._preview_image()
+        h, w = shown.shape[:2]
+        return Image.frombuffer("RGB", (w, h), shown, "raw", "BGRX", 0, 1)
+
+    def _dirty_box(self, shown: Optional[np.ndarray]) -> Optional[Tuple[int, int, int, int]]:
+        """Boîte (x0, y0, x1, y1), alignée sur des tuiles de 64 px, des pixels modifiés depuis
+        l'image affichée précédente ; None si une réécriture complète est préférable."""
+        prev = self._shown_bgra
+        if shown is None or prev is None or prev.shape != shown.shape:
+            return None
+        # Comparaison pixel par pixel (BGRA vu comme un uint32)
+        diff = shown.view(np.uint32)[:, :, 0] != prev.view(np.uint32)[:, :, 0]
+        rows = np.flatnonzero(diff.any(axis=1))
+        if rows.size == 0:
+            return 0, 0, 0, 0
+        cols = np.flatnonzero(diff.any(axis=0))
+        h, w = diff.shape
+        tile = _DIRTY_TILE
+        y0, y1 = rows[0] // tile * tile, min(h, (rows[-1] // tile + 1) * tile)
+        x0, x1 = cols[0] // tile * tile, min(w, (cols[-1] // tile + 1) * tile)
+        if (x1 - x0) * (y1 - y0) * 2 > w * h:
+            return None  # plus de la moitié de l'image : paste complet
+        return int(x0), int(y0), int(x1), int(y1)
+
+    def _apply_overlay_visibility(self):
+        """Affiche/masque les overlays existants par tag, sans recapture ni nouveau PhotoImage."""
+        for tag, var in (
+            ("roi", self.show_rectangles),
+            ("table_zone", self.show_table_zone),
+            ("card_zone", self.show_card_zones),
+            ("text_zone", self.show_text_zones),
+        ):
+            self._set_tag_visibility(tag, var.get())
+        if not self.show_labels.get():
+            self._set_tag_visibility("label", False)
+
+    def _set_tag_visibility(self, tag: str, visible: bool):
+        self.canvas.itemconfigure(tag, state="normal" if visible else "hidden")
+
+    def _draw_overlays(self, disp_w: int, disp_h: int, raw_img: Optional[Image.Image], eff_scale: float):
+        # Les items d'overlay (tagués) sont créés une fois puis déplacés via coords ; leur
+        # visibilité est gérée par _apply_overlay_visibility pour des cases à cocher instantanées.
+        # Les groupes masqués ne sont pas recalculés : leurs items restent en place jusqu'au
+        # prochain affichage (_on_overlay_toggle redessine).
+        show_rects = self.show_rectangles.get()
+        show_labels = self.show_labels.get()
+        show_table = self.show_table_zone.get()
+        show_cards = self.show_card_zones.get()
+        show_text = self.show_text_zones.get()
+        if not (show_rects or show_table or show_cards or show_text):
+            return  # tout est masqué : rien à déplacer
+        self._overlay_seen = set()
         try:
             ox, oy = self._offset_x, self._offset_y
-            if self.show_table_zone.get():
+            if show_table:
                 ax, ay, aw, ah = self._get_anchor_norm()
                 ax0 = int(ax * disp_w) + ox; ay0 = int(ay * disp_h) + oy
                 ax1 = int((ax + aw) * disp_w) + ox; ay1 = int((ay + ah) * disp_h) + oy
-                self.canvas.create_rectangle(ax0, ay0, ax1, ay1, outline="#ffaa00", width=2, dash=(6, 4))
-                self.canvas.create_text(ax0 + 4, ay0 + 12, anchor=tk.W, text="table_zone", fill="#ffaa00", font=("Segoe UI", 9, "bold"))
+                self._overlay_rect(("table_zone",), ax0, ay0, ax1, ay1, outline="#ffaa00", width=2, dash=(6, 4), tags=("overlay", "table_zone"))
+                self._overlay_text(("table_zone", "label"), ax0 + 4, ay0 + 12, anchor=tk.W, text="table_zone", fill="#ffaa00", font=("Segoe UI", 9, "bold"), tags=("overlay", "table_zone"))
+            else:
+                self._keep_overlays("table_zone")
 
-            if self.show_rectangles.get():
+            if not show_rects:
+                self._keep_overlays("roi")
+            elif show_labels:
                 for name, x0, y0, x1, y1 in self._iter_roi_rects(disp_w, disp_h):
                     x0 += ox; y0 += oy; x1 += ox; y1 += oy
-                    self.canvas.create_rectangle(x0, y0, x1, y1, outline="#00d0ff", width=2)
-                    if self.show_labels.get():
-                        self.canvas.create_text(x0 + 4, y0 + 12, anchor=tk.W, text=name, fill="#00d0ff", font=("Segoe UI", 9, "bold"))
-            
+                    self._overlay_rect(("roi", name), x0, y0, x1, y1, outline="#00d0ff", width=2, tags=("overlay", "roi"))
+                    self._overlay_text(("roi", name, "label"), x0 + 4, y0 + 12, anchor=tk.W, text=name, fill="#00d0ff", font=("Segoe UI", 9, "bold"), tags=("overlay", "roi", "label"))
+            else:
+                # Rectangles seuls : les libellés (masqués) ne sont pas déplacés
+                self._keep_overlays("roi", labels_only=True)
+                for name, x0, y0, x1, y1 in self._iter_roi_rects(disp_w, disp_h):
+                    self._overlay_rect(("roi", name), x0 + ox, y0 + oy, x1 + ox, y1 + oy, outline="#00d0ff", width=2, tags=("overlay", "roi"))
+
             # Dessine les zones de rank et suit des cartes
-            if self.show_card_zones.get():
-                self._draw_card_zones(disp_w, disp_h, ox, oy)
+            if show_cards:
+                self._draw_card_zones(disp_w, disp_h, ox, oy, show_labels)
+            else:
+                self._keep_overlays("card_zone")
 
             # Dessine les zones OCR texte (jaune)
-            if self.show_text_zones.get() and self.text_pipeline is not None:
+            if self.text_pipeline is not None and not show_text:
+                self._keep_overlays("text_zone")
+            elif self.text_pipeline is not None:
                 try:
-                    # Utilise le frame brut pour obtenir les rects en px
-                    frame_bgr = None
-                    if 'cv2' in globals():
-                        frame_bgr = cv2.cvtColor(np.array(raw_img), cv2.COLOR_RGB2BGR)
-                    rects = self.text_pipeline.get_text_zone_rects(frame_bgr if frame_bgr is not None else np.array(raw_img))
+                    # Utilise le frame brut (déjà en BGR) pour obtenir les rects en px
+                    frame_bgr = self._last_raw_bgr
+                    rects = self.text_pipeline.get_text_zone_rects(frame_bgr if frame_bgr is not None else np.array(raw_img or self._preview_image()))
                     for name, (x0, y0, x1, y1) in rects.items():
                         # Mise à l'échelle + offset
                         sx0 = int(x0 * eff_scale) + ox
                         sy0 = int(y0 * eff_scale) + oy
                         sx1 = int(x1 * eff_scale) + ox
                         sy1 = int(y1 * eff_scale) + oy
-                        self.canvas.create_rectangle(sx0, sy0, sx1, sy1, outline="#ffd000", width=2, dash=(4, 3))
-                        if self.show_labels.get():
-                            self.canvas.create_text(sx0 + 4, sy0 + 12, anchor=tk.W, text=name, fill="#ffd000", font=("Segoe UI", 9, "bold"))
+                        self._overlay_rect(("text_zone", name), sx0, sy0, sx1, sy1, outline="#ffd000", width=2, dash=(4, 3), tags=("overlay", "text_zone"))
+                        if show_labels:
+                            self._overlay_text(("text_zone", name, "label"), sx0 + 4, sy0 + 12, anchor=tk.W, text=name, fill="#ffd000", font=("Segoe UI", 9, "bold"), tags=("overlay", "text_zone", "label"))
+                    if not show_labels:
+                        self._keep_overlays("text_zone", labels_only=True)
                 except Exception as e:
                     print(f"Debug: Erreur zones OCR: {e}")
         except Exception as e:
             print(f"Debug: Erreur overlays: {e}")
+        # Supprime les items dont la zone n'existe plus
+        for key in self._overlay_items.keys() - self._overlay_seen:
+            self.canvas.delete(self._overlay_items.pop(key))
+        self._apply_overlay_visibility()
+
+    def _keep_overlays(self, group: str, labels_only: bool = False):
+        """Conserve tels quels les items existants d'un groupe masqué (ni déplacés ni supprimés)."""
+        self._overlay_seen.update(
+            key for key in self._overlay_items
+            if key[0] == group and (not labels_only or key[-1] == "label")
+        )
+
+    def _on_overlay_toggle(self):
+        self._apply_overlay_visibility()
+        self._request_redraw()  # recale les groupes réaffichés (non déplacés tant que masqués)
+
+    def _overlay_rect(self, key: tuple, x0: int, y0: int, x1: int, y1: int, **opts):
+        """Rectangle d'overlay identifié par `key` : créé au premier dessin, ensuite seulement déplacé."""
+        self._overlay_seen.add(key)
+        item = self._overlay_items.get(key)
+        if item is None:
+            self._overlay_items[key] = self.canvas.create_rectangle(x0, y0, x1, y1, **opts)
+        else:
+            self.canvas.coords(item, x0, y0, x1, y1)
+
+    def _overlay_text(self, key: tuple, x: int, y: int, **opts):
+        """Libellé d'overlay identifié par `key` (texte fixe pour une clé donnée)."""
+        self._overlay_seen.add(key)
+        item = self._overlay_items.get(key)
+        if item is None:
+            self._overlay_items[key] = self.canvas.create_text(x, y, **opts)
+        else:
+            self.canvas.coords(item, x, y)
+
+    def _clear_overlays(self):
+        self.canvas.delete("overlay")
+        self._overlay_items.clear()
 
-    def _draw_card_zones(self, disp_w: int, disp_h: int, ox: int, oy: int):
+    def _draw_card_zones(self, disp_w: int, disp_h: int, ox: int, oy: int, labels: bool = True):
         """Dessine les zones de rank et suit des cartes."""
         try:
             if not self.cfg or 'card_zones' not in self.cfg:
@@ -719,20 +1321,27 @@ class LivePreview(tk.Tk):
                         label_color = "#aaaaaa"
                     
                     # Dessine le rectangle de la zone
-                    self.canvas.create_rectangle(
+                    self._overlay_rect(
+                        ("card_zone", card_name, zone_name),
                         zone_abs_x0, zone_abs_y0, zone_abs_x1, zone_abs_y1,
-                        outline=color, width=2, dash=(3, 3)
+                        outline=color, width=2, dash=(3, 3),
+                        tags=("overlay", "card_zone")
                     )
                     
-                    # Ajoute le label si activé
-                    if self.show_labels.get():
-                        label_text = f"{zone_type}"
-                        self.canvas.create_text(
-                            zone_abs_x0 + 2, zone_abs_y0 + 2,
-                            anchor=tk.NW, text=label_text,
-                            fill=label_color, font=("Segoe UI", 8, "bold")
-                        )
+                    # Ajoute le label (masqué via le tag "label" si désactivé)
+                    if not labels:
+                        continue
+                    label_text = f"{zone_type}"
+                    self._overlay_text(
+                        ("card_zone", card_name, zone_name, "label"),
+                        zone_abs_x0 + 2, zone_abs_y0 + 2,
+                        anchor=tk.NW, text=label_text,
+                        fill=label_color, font=("Segoe UI", 8, "bold"),
+                        tags=("overlay", "card_zone", "label")
+                    )
                         
+            if not labels:
+                self._keep_overlays("card_zone", labels_only=True)
         except Exception as e:
             print(f"Debug: Erreur zones cartes: {e}")
 
@@ -797,11 +1406,8 @@ class LivePreview(tk.Tk):
     def _export_cards(self):
         """Exporte les cartes détectées en PNG dans un sous-dossier daté."""
         try:
-            # Recapture ou utilise la dernière image
-            if self._last_raw is None:
-                self._capture_raw()
-            
-            if self._last_raw is None:
+            # Utilise la dernière image de la boucle (recapture seulement si absente/périmée)
+            if not self._ensure_recent_frame():
                 messagebox.showerror("Export", "Aucune image disponible pour l'export")
                 return
             
@@ -815,34 +1421,37 @@ class LivePreview(tk.Tk):
             from datetime import datetime
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             export_dir = f"exported_cards_{timestamp}"
-            os.makedirs(export_dir, exist_ok=True)
+            self._ensure_dir(export_dir)
             
-            # Exporte chaque carte
-            exported_count = 0
+            # Crop chaque carte (l'encodage PNG est fait ensuite en parallèle)
+            raw_np = self._raw_rgb_array()
+            save_tasks: List[Tuple[str, np.ndarray]] = []
             for roi_name, roi_px in card_rois.items():
                 try:
                     # Applique l'inflate si défini
                     inflated_roi = self._apply_roi_inflate(roi_name, roi_px)
                     
                     # Crop la carte
-                    card_img = self._crop_roi(self._last_raw, inflated_roi)
+                    card_img = self._crop_roi(raw_np, inflated_roi)
                     if card_img is None:
                         continue
                     
-                    # Sauvegarde
                     filename = f"{roi_name}.png"
-                    filepath = os.path.join(export_dir, filename)
-                    card_img.save(filepath, "PNG")
-                    exported_count += 1
+                    save_tasks.append((os.path.join(export_dir, filename), card_img))
                     
                 except Exception as e:
-                    print(f"Erreur export {roi_name}: {e}")
+                    logger.warning("Erreur export %s: %s", roi_name, e)
                     continue
             
-            if exported_count > 0:
-                messagebox.showinfo("Export", f"{exported_count} cartes exportées dans:\n{os.path.abspath(export_dir)}")
-            else:
-                messagebox.showwarning("Export", "Aucune carte n'a pu être exportée")
+            def _report(saved: List[bool]):
+                exported_count = sum(saved)
+                if exported_count > 0:
+                    messagebox.showinfo("Export", f"{exported_count} cartes exportées dans:\n{os.path.abspath(export_dir)}")
+                else:
+                    messagebox.showwarning("Export", "Aucune carte n'a pu être exportée")
+            
+            # Sauvegarde hors du thread Tk (l'aperçu continue de tourner)
+            self._save_in_background(save_tasks, _report)
                 
         except Exception as e:
             messagebox.showerror("Export", f"Erreur lors de l'export:\n{e}")
@@ -860,11 +1469,8 @@ class LivePreview(tk.Tk):
                 messagebox.showerror("Export Templates", "Aucune zone de carte trouvée dans le YAML")
                 return
             
-            # Recapture ou utilise la dernière image
-            if self._last_raw is None:
-                self._capture_raw()
-            
-            if self._last_raw is None:
+            # Utilise la dernière image de la boucle (recapture seulement si absente/périmée)
+            if not self._ensure_recent_frame():
                 messagebox.showerror("Export Templates", "Aucune image disponible pour l'export")
                 return
             
@@ -878,84 +1484,169 @@ class LivePreview(tk.Tk):
             ranks_dir = os.path.join(templates_dir, "ranks")
             suits_dir = os.path.join(templates_dir, "suits")
             
-            # Crée tous les dossiers nécessaires
-            os.makedirs(ranks_dir, exist_ok=True)
-            os.makedirs(suits_dir, exist_ok=True)
+            # Crée tous les dossiers nécessaires (une seule fois par session)
+            self._ensure_dir(ranks_dir)
+            self._ensure_dir(suits_dir)
             
             # Compteurs pour les noms de fichiers incrémentaux
             rank_counter = self._get_next_template_number(ranks_dir, "rank")
             suit_counter = self._get_next_template_number(suits_dir, "suit")
             
-            exported_ranks = 0
-            exported_suits = 0
+            # Vue RGB (H, W, 3) sur le buffer capturé : les zones sont des slices, sans copie
+            raw_np = self._raw_rgb_array()
+            raw_h, raw_w = raw_np.shape[:2]
             
-            # Parcourt toutes les cartes avec leurs zones
-            for card_name, zones in card_zones.items():
-                # Trouve la ROI de la carte dans le layout
-                card_roi = self._get_card_roi(card_name)
-                if not card_roi:
+            # (chemin, image, type) : les PNG sont encodés en parallèle après la boucle
+            save_tasks: List[Tuple[str, np.ndarray]] = []
+            save_types: List[str] = []
+            
+            # Parcourt toutes les cartes du plan (zones déjà extraites du YAML)
+            for card in self._get_export_plan():
+                # Convertit la ROI de la carte en pixels
+                card_x0, card_y0, card_x1, card_y1 = self._roi_to_pixels_legacy(card.card_roi, raw_w, raw_h)
+                card_w = card_x1 - card_x0
+                card_h = card_y1 - card_y0
+                
+                # Un seul crop par carte (borné à l'image) ; rank et suit en sont des sous-vues
+                cx0, cy0 = max(0, card_x0), max(0, card_y0)
+                cx1, cy1 = min(raw_w, card_x1), min(raw_h, card_y1)
+                if cx1 <= cx0 or cy1 <= cy0:
                     continue
+                card_slice = raw_np[cy0:cy1, cx0:cx1]
+                slice_h, slice_w = card_slice.shape[:2]
                 
-                # Convertit la ROI de la carte en pixels
-                card_x0, card_y0, card_x1, card_y1 = self._roi_to_pixels_legacy(card_roi, self._last_raw.width, self._last_raw.height)
+                # Coordonnées (x0, y0, x1, y1) des zones dans card_slice, en une passe
+                dx, dy = card_x0 - cx0, card_y0 - cy0
+                zones_rel = (card.zones_xyxy * (card_w, card_h, card_w, card_h)).astype(np.int64)
+                zones_rel += (dx, dy, dx, dy)
                 
                 # Dessine chaque zone de la carte
-                for zone_name, zone_config in zones.items():
-                    zone_type = zone_config.get('type', 'unknown')
-                    zone_x = zone_config.get('x', 0)
-                    zone_y = zone_config.get('y', 0)
-                    zone_w = zone_config.get('w', 0)
-                    zone_h = zone_config.get('h', 0)
-                    
-                    # Calcule les coordonnées absolues de la zone
-                    zone_abs_x0 = card_x0 + int(zone_x * (card_x1 - card_x0))
-                    zone_abs_y0 = card_y0 + int(zone_y * (card_y1 - card_y0))
-                    zone_abs_x1 = card_x0 + int((zone_x + zone_w) * (card_x1 - card_x0))
-                    zone_abs_y1 = card_y0 + int((zone_y + zone_h) * (card_y1 - card_y0))
+                for zone_name, zone_type, (zx0, zy0, zx1, zy1) in zip(
+                    card.zone_names, card.zone_types, zones_rel.tolist(), strict=True
+                ):
+                    # Borne la zone à la carte (un slice numpy ne tolère pas d'indices négatifs)
+                    zx0 = max(0, zx0); zy0 = max(0, zy0)
+                    zx1 = min(slice_w, zx1); zy1 = min(slice_h, zy1)
                     
                     # Vérifie que la zone est valide
-                    if zone_abs_x1 <= zone_abs_x0 or zone_abs_y1 <= zone_abs_y0:
+                    if zx1 <= zx0 or zy1 <= zy0:
                         continue
                     
-                    # Crop la zone
+                    # Crop la zone (seul le slice sauvegardé est matérialisé en image)
                     try:
-                        zone_img = self._last_raw.crop((zone_abs_x0, zone_abs_y0, zone_abs_x1, zone_abs_y1))
+                        zone_img = card_slice[zy0:zy1, zx0:zx1]
                         
-                        # Sauvegarde selon le type avec noms incrémentaux
+                        # Planifie la sauvegarde selon le type avec noms incrémentaux
                         if zone_type == 'rank':
                             filename = f"rank_{rank_counter:03d}.png"
-                            filepath = os.path.join(ranks_dir, filename)
-                            zone_img.save(filepath, "PNG")
-                            exported_ranks += 1
+                            save_tasks.append((os.path.join(ranks_dir, filename), zone_img))
+                            save_types.append(zone_type)
                             rank_counter += 1
                             
                         elif zone_type == 'suit':
                             filename = f"suit_{suit_counter:03d}.png"
-                            filepath = os.path.join(suits_dir, filename)
-                            zone_img.save(filepath, "PNG")
-                            exported_suits += 1
+                            save_tasks.append((os.path.join(suits_dir, filename), zone_img))
+                            save_types.append(zone_type)
                             suit_counter += 1
                             
                     except Exception as e:
-                        print(f"Erreur export zone {zone_name} ({zone_type}): {e}")
+                        logger.warning("Erreur export zone %s (%s): %s", zone_name, zone_type, e)
                         continue
             
-            # Message de confirmation
-            total_exported = exported_ranks + exported_suits
-            if total_exported > 0:
-                message = f"Templates exportés avec succès!\n\n"
-                message += f"🔴 Rangs: {exported_ranks} templates\n"
-                message += f"🟢 Couleurs: {exported_suits} templates\n"
-                message += f"📁 Dossier: {os.path.abspath(templates_dir)}\n\n"
-                message += f"💡 Structure: assets/templates/{room_name}/{layout_name}/\n"
-                message += "🔄 Export incrémental activé - les clics suivants ajouteront des templates"
-                messagebox.showinfo("Export Templates", message)
-            else:
-                messagebox.showwarning("Export Templates", "Aucun template n'a pu être exporté")
+            # Les clics suivants reprennent la numérotation en mémoire
+            self._template_counters[(ranks_dir, "rank")] = rank_counter
+            self._template_counters[(suits_dir, "suit")] = suit_counter
+            
+            def _report(saved: List[bool]):
+                exported_ranks = sum(ok for ok, t in zip(saved, save_types, strict=True) if t == 'rank')
+                exported_suits = sum(ok for ok, t in zip(saved, save_types, strict=True) if t == 'suit')
+                
+                # Message de confirmation
+                total_exported = exported_ranks + exported_suits
+                if total_exported > 0:
+                    message = f"Templates exportés avec succès!\n\n"
+                    message += f"🔴 Rangs: {exported_ranks} templates\n"
+                    message += f"🟢 Couleurs: {exported_suits} templates\n"
+                    message += f"📁 Dossier: {os.path.abspath(templates_dir)}\n\n"
+                    message += f"💡 Structure: assets/templates/{room_name}/{layout_name}/\n"
+                    message += "🔄 Export incrémental activé - les clics suivants ajouteront des templates"
+                    messagebox.showinfo("Export Templates", message)
+                else:
+                    messagebox.showwarning("Export Templates", "Aucun template n'a pu être exporté")
+            
+            # Encodage + écriture en parallèle, hors du thread Tk (l'aperçu continue de tourner)
+            self._save_in_background(save_tasks, _report)
                 
         except Exception as e:
             messagebox.showerror("Export Templates", f"Erreur lors de l'export des templates: {e}")
 
+    def _get_export_plan(self) -> List[CardExportPlan]:
+        """Aplatit card_zones + ROIs du layout courant ; recalculé seulement si YAML/layout change."""
+        key = (id(self.cfg), self.layout_var.get())
+        if self._export_plan is not None and key == self._export_plan_key:
+            return self._export_plan
+        plan: List[CardExportPlan] = []
+        for card_name, zones in (self.cfg.get('card_zones') or {}).items():
+            # Trouve la ROI de la carte dans le layout
+            card_roi = self._get_card_roi(card_name)
+            if not card_roi or not zones:
+                continue
+            zones_xywh = np.array(
+                [[z.get('x', 0), z.get('y', 0), z.get('w', 0), z.get('h', 0)] for z in zones.values()],
+                dtype=np.float64,
+            )
+            zones_xyxy = zones_xywh.copy()
+            zones_xyxy[:, 2:] += zones_xywh[:, :2]
+            plan.append(CardExportPlan(
+                card_name=card_name,
+                card_roi=card_roi,
+                zone_names=list(zones.keys()),
+                zone_types=[z.get('type', 'unknown') for z in zones.values()],
+                zones_xyxy=zones_xyxy,
+            ))
+        self._export_plan = plan
+        self._export_plan_key = key
+        return plan
+
+    def _save_in_background(self, save_tasks: List[Tuple[str, np.ndarray]], on_done):
+        """Écrit les images dans un thread dédié puis appelle on_done(saved) sur le thread Tk.
+
+        Les crops sont des vues sur le buffer (immuable) d'une frame déjà capturée : aucun état partagé.
+        """
+        def _worker():
+            saved = _save_images_parallel(save_tasks)
+            self._ui_calls.put(lambda: on_done(saved))
+
+        self._pending_saves += 1
+        if self._pending_saves == 1:
+            self.after(50, self._drain_ui_calls)
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _drain_ui_calls(self):
+        """Exécute sur le thread Tk les callbacks des exports terminés ; repoll tant qu'il en reste."""
+        while True:
+            try:
+                callback = self._ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            self._pending_saves -= 1
+            try:
+                callback()
+            except Exception as e:  # ne doit pas interrompre le poll des exports suivants
+                logger.warning("Erreur fin d'export: %s", e)
+        if self._pending_saves > 0 and self._running:
+            self.after(50, self._drain_ui_calls)
+
+    def _ensure_dir(self, directory: str):
+        """os.makedirs mémorisé : les clics d'export suivants n'interrogent plus le disque."""
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
+    def _raw_rgb_array(self) -> np.ndarray:
+        """Dernière frame en RGB (H, W, 3) : vue sur le buffer BGRA, canaux inversés, sans copie."""
+        return self._last_raw_np[:, :, 2::-1]
+
     def _build_recognition_panel(self):
         """Construit le panneau d'affichage de la reconnaissance."""
         # Panneau de reconnaissance
@@ -1108,38 +1799,29 @@ class LivePreview(tk.Tk):
             self.strategy_reason_label.config(text="Raison: --")
 
     def _get_next_template_number(self, directory: str, prefix: str) -> int:
-        """Retourne le prochain numéro disponible pour les templates."""
+        """Retourne le prochain numéro disponible pour les templates.
+
+        Le dossier n'est scanné qu'au premier export ; ensuite le compteur est tenu en mémoire.
+        """
+        cached = self._template_counters.get((directory, prefix))
+        if cached is not None:
+            return cached
         try:
-            if not os.path.exists(directory):
-                return 1
-            
-            # Liste tous les fichiers avec le préfixe donné
-            existing_files = [f for f in os.listdir(directory) if f.startswith(prefix) and f.endswith('.png')]
-            
-            if not existing_files:
-                return 1
-            
-            # Extrait les numéros existants
-            numbers = []
-            for filename in existing_files:
-                try:
-                    # Format attendu: prefix_XXX.png
-                    number_part = filename.replace(f"{prefix}_", "").replace(".png", "")
-                    numbers.append(int(number_part))
-                except ValueError:
-                    continue
-            
-            if not numbers:
-                return 1
-            
-            # Retourne le prochain numéro disponible
-            return max(numbers) + 1
-            
+            # Format attendu: prefix_XXX.png
+            numbers = (
+                int(number_part)
+                for path in Path(directory).glob(f"{prefix}_*.png")
+                if (number_part := path.stem.removeprefix(f"{prefix}_")).isdigit()
+            )
+            return max(numbers, default=0) + 1
         except Exception:
             return 1
     
     def _get_card_rois(self) -> Dict[str, Tuple[int, int, int, int]]:
-        """Retourne les ROIs de cartes en pixels."""
+        """Retourne les ROIs de cartes en pixels (mémorisées jusqu'au prochain changement de config)."""
+        key = (id(self.cfg), self.layout_var.get(), self.relative_to_var.get(), self._get_client_size())
+        if self._card_rois_cache is not None and key == self._card_rois_cache_key:
+            return self._card_rois_cache
         card_rois = {}
         
         # Récupère le layout actuel
@@ -1151,35 +1833,44 @@ class LivePreview(tk.Tk):
         layout = layouts[layout_name]
         rois = layout.get("rois", {})
         
-        # Détecte les cartes par type ou regex sur le nom
+        # Détecte les cartes par type ou regex sur le nom, et collecte leurs (x, y, w, h) normalisés
+        names = []
+        xywh = []
         for roi_name, roi_config in rois.items():
-            # Vérifie si c'est une carte par type
-            if isinstance(roi_config, dict) and roi_config.get("type") == "card":
-                roi_px = self._roi_to_pixels(roi_config)
-                if roi_px:
-                    card_rois[roi_name] = roi_px
-            # Sinon vérifie par regex sur le nom
-            elif self._is_card_roi_name(roi_name):
-                roi_px = self._roi_to_pixels(roi_config)
-                if roi_px:
-                    card_rois[roi_name] = roi_px
+            is_card = (isinstance(roi_config, dict) and roi_config.get("type") == "card") or self._is_card_roi_name(roi_name)
+            if not is_card:
+                continue
+            try:
+                if isinstance(roi_config, dict):
+                    row = [float(roi_config.get(k, 0.0)) for k in ("x", "y", "w", "h")]
+                else:
+                    # Format tuple/list
+                    x, y, w, h = roi_config
+                    row = [float(x), float(y), float(w), float(h)]
+            except Exception as e:
+                logger.warning("Erreur conversion ROI: %s", e)
+                continue
+            names.append(roi_name)
+            xywh.append(row)
         
+        if names:
+            # Base (origine + dimensions) calculée une fois, puis conversion de toutes les ROIs en une passe
+            if self.relative_to_var.get() == "table_zone":
+                base_x, base_y, base_w, base_h = self._get_anchor_pixels()
+            else:
+                base_x, base_y = 0, 0
+                base_w, base_h = self._get_client_size()
+            norm = np.asarray(xywh, dtype=np.float64)
+            px = (norm * (base_w, base_h, base_w, base_h) + (base_x, base_y, 0, 0)).astype(np.int64)
+            card_rois = {name: tuple(row) for name, row in zip(names, px.tolist(), strict=True)}
+        
+        self._card_rois_cache = card_rois
+        self._card_rois_cache_key = key
         return card_rois
     
     def _is_card_roi_name(self, name: str) -> bool:
         """Détermine si un nom de ROI correspond à une carte."""
-        import re
-        # Patterns pour détecter les cartes
-        card_patterns = [
-            r'board_card\d+',  # board_card1, board_card2, etc.
-            r'hero_cards_(left|right)',  # hero_cards_left, hero_cards_right
-            r'.*card.*',  # tout nom contenant "card"
-        ]
-        
-        for pattern in card_patterns:
-            if re.search(pattern, name, re.IGNORECASE):
-                return True
-        return False
+        return bool(_CARD_NAME_RE.search(name))
     
     def _roi_to_pixels(self, roi_config: Dict[str, Any]) -> Optional[Tuple[int, int, int, int]]:
         """Convertit une ROI normalisée en pixels selon la base choisie."""
@@ -1213,7 +1904,7 @@ class LivePreview(tk.Tk):
             return (px_x, px_y, px_w, px_h)
             
         except Exception as e:
-            print(f"Erreur conversion ROI: {e}")
+            logger.warning("Erreur conversion ROI: %s", e)
             return None
     
     def _get_anchor_pixels(self) -> Tuple[int, int, int, int]:
@@ -1281,14 +1972,14 @@ class LivePreview(tk.Tk):
             return roi_px
             
         except Exception as e:
-            print(f"Erreur inflate ROI {roi_name}: {e}")
+            logger.warning("Erreur inflate ROI %s: %s", roi_name, e)
             return roi_px
     
-    def _crop_roi(self, img: Image.Image, roi_px: Tuple[int, int, int, int]) -> Optional[Image.Image]:
-        """Crop une région d'image selon les coordonnées pixels."""
+    def _crop_roi(self, img: np.ndarray, roi_px: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        """Crop une région d'image (vue numpy, sans copie) selon les coordonnées pixels."""
         try:
             x, y, w, h = roi_px
-            img_w, img_h = img.size
+            img_h, img_w = img.shape[:2]
             
             # Assure que les coordonnées sont dans les limites
             x = max(0, min(x, img_w))
@@ -1296,24 +1987,40 @@ class LivePreview(tk.Tk):
             w = max(1, min(w, img_w - x))
             h = max(1, min(h, img_h - y))
             
-            return img.crop((x, y, x + w, y + h))
+            return img[y:y + h, x:x + w]
             
         except Exception as e:
-            print(f"Erreur crop ROI: {e}")
+            logger.warning("Erreur crop ROI: %s", e)
             return None
 
     # ------------------------- divers -------------------------
     def _request_redraw(self):
-        # rien à faire ici: la boucle principale rafraîchit en continu; cette
-        # fonction existe pour harmoniser les callbacks et éviter les recaptures inutiles
-        pass
+        """Redessine la dernière frame sans recapture, regroupé sur ~16 ms.
+
+        Un drag de fenêtre envoie un <Configure> par pixel : seul le dernier déclenche un rendu.
+        Réservée aux changements qui exigent un recalcul des pixels (zoom, base, layout) ;
+        les cases d'affichage passent par _apply_overlay_visibility.
+        """
+        if self._redraw_after_id is not None:
+            self.after_cancel(self._redraw_after_id)
+        self._redraw_after_id = self.after(16, self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_after_id = None
+        if self._running and self._last_raw_np is not None:
+            self._render_frame(self._last_raw_np, None)
 
     def _on_close(self):
         self._running = False
+        self._capture_stop.set()
+        if self._redraw_after_id is not None:
+            self.after_cancel(self._redraw_after_id)
         try:
+            self._gdi.close()
             if self._sct:
                 self._sct.close()
         finally:
+            _stop_log_listener()
             self.after(100, self.destroy)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import sys
 import time
+import logging
 import threading
 import ctypes
 from dataclasses import dataclass
@@ -8,6 +9,8 @@ from typing import Optional, List, Dict, Protocol, Tuple
 
 import customtkinter as ctk
 
+logger = logging.getLogger(__name__)
+
 # === Modèle d'état (on réutilise ton modèle si déjà présent) ==================
 try:
     # Si ton modèle existe déjà, on l'importe.
@@ -38,14 +41,25 @@ class HUDDataProvider(Protocol):
 # === Mini utilitaires d'affichage =============================================
 SUIT_MAP = {"h": "♥", "d": "♦", "c": "♣", "s": "♠"}
 
-def pretty_card(c: str) -> str:
+def _pretty_card_slow(c: str) -> str:
     if not c or c == "??" or len(c) < 2:
         return "??"
     r, s = c[0], c[1].lower()
     return f"{r}{SUIT_MAP.get(s, s)}"
 
+# Cartes standard pré-formatées (rang + couleur, couleur en minuscule ou majuscule)
+_CARD_LUT: Dict[str, str] = {
+    r + s: f"{r}{SUIT_MAP[s.lower()]}" for r in "23456789TJQKA" for s in "hdcsHDCS"
+}
+_CARD_LUT["??"] = "??"
+
+def pretty_card(c: str) -> str:
+    # un seul dict.get pour les cartes connues ; formats atypiques -> chemin historique
+    return _CARD_LUT.get(c) or _pretty_card_slow(c)
+
 def join_cards(arr: List[str]) -> str:
-    return " ".join(pretty_card(c) for c in arr if c and c != "??")
+    lut = _CARD_LUT
+    return " ".join(lut.get(c) or _pretty_card_slow(c) for c in arr if c and c != "??")
 
 def fmt_money(x: Optional[float]) -> str:
     if x is None: return "—"
@@ -54,27 +68,41 @@ def fmt_money(x: Optional[float]) -> str:
 
 # === Composants UI =============================================================
 class LoadingSpinner(ctk.CTkLabel):
-    FRAMES = ["⠋","⠙","⠹","⠸","⠼","⠴","⠦","⠧","⠇","⠏"]
+    FRAMES = ("⠋","⠙","⠹","⠸","⠼","⠴","⠦","⠧","⠇","⠏")
     def __init__(self, master, text="Initialisation…", **kw):
         super().__init__(master, text="", **kw)
         self._idx = 0
+        self._frame_count = len(self.FRAMES)
+        self._after_id = None
         self._label = ctk.CTkLabel(master, text=text, font=("Inter", 14))
         self._label.pack(pady=(6,0))
         self._running = False
         self.configure(font=("Inter", 28))
 
     def start(self):
+        if self._running: return  # une seule boucle d'animation
         self._running = True
         self._animate()
 
     def stop(self):
         self._running = False
+        if self._after_id is not None:
+            try:
+                self.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
 
     def _animate(self):
+        self._after_id = None
         if not self._running: return
-        self._idx = (self._idx + 1) % len(self.FRAMES)
+        if not self.winfo_manager() or not self.master.winfo_manager():
+            # spinner ou vue de chargement retirés (pack_forget) : on arrête la boucle
+            self._running = False
+            return
+        self._idx = (self._idx + 1) % self._frame_count
         self.configure(text=self.FRAMES[self._idx])
-        self.after(100, self._animate)
+        self._after_id = self.after(100, self._animate)
 
 class ConfidenceBar(ctk.CTkFrame):
     def __init__(self, master, **kw):
@@ -94,6 +122,9 @@ class StatusPill(ctk.CTkLabel):
         if conf >= 0.75: color = ("#1f6f43", "#1f6f43")   # vert
         elif conf >= 0.5: color = ("#8a6d1e", "#8a6d1e") # ambre
         else: color = ("#7a1f1f", "#7a1f1f")             # rouge
+        if getattr(self, "_last", None) == (text, color):
+            return  # inchangé : pas de configure (évite un recalcul de géométrie Tk)
+        self._last = (text, color)
         self.configure(text=text, fg_color=color, corner_radius=999, padx=10, pady=4)
 
 # === Fenêtre HUD ===============================================================
@@ -147,6 +178,7 @@ class PokerHUD(ctk.CTk):
         self._schedule = _schedule
         self._cancel_all_jobs = _cancel_all_jobs
         self._last_seen_ts: float = 0.0
+        self._txt_cache: Dict[str, str] = {}  # dernier texte affiché par label (cf. _set_text)
 
         # ---- Conteneur principal
         self._main_container = ctk.CTkFrame(self, corner_radius=16, border_width=1)
@@ -209,7 +241,7 @@ class PokerHUD(ctk.CTk):
         self._poll_provider()
         
         # Empêcher la fermeture automatique - l'utilisateur doit fermer manuellement
-        print("🎮 Overlay ouvert - Utilisez Échap pour fermer ou F8 pour basculer la visibilité")
+        logger.info("🎮 Overlay ouvert - Utilisez Échap pour fermer ou F8 pour basculer la visibilité")
 
     # ---- Drag window
     def _on_click(self, e):
@@ -285,7 +317,7 @@ class PokerHUD(ctk.CTk):
                     self._last_seen_ts = snap_ts
                 self._render(st, pol)
         except Exception as e:
-            print(f"⚠️ Erreur polling HUD: {e}")
+            logger.warning("⚠️ Erreur polling HUD: %s", e)
         finally:
             # ✅ un seul after planifié par tick
             try:
@@ -295,19 +327,20 @@ class PokerHUD(ctk.CTk):
 
     # ---- Rendering
     def _render(self, st: HandState, pol: Dict):
-        # Debug: afficher ce qui est reçu
-        print(f"🎨 Rendu HUD - Hero: {st.hero_cards}, Board: {st.board}, Policy: {pol}")
-        
+        # Debug: afficher ce qui est reçu (aucun formatage si DEBUG inactif)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🎨 Rendu HUD - Hero: %s, Board: %s, Policy: %s", st.hero_cards, st.board, pol)
+
         # cartes
         hero_text = join_cards(st.hero_cards or [])
         board_text = join_cards(st.board or [])
-        self._hero_lbl.configure(text=f"Hero: {hero_text}")
-        self._board_lbl.configure(text=f"Board: {board_text}")
+        self._set_text(self._hero_lbl, "hero", f"Hero: {hero_text}")
+        self._set_text(self._board_lbl, "board", f"Board: {board_text}")
 
         # montants
-        self._pot_lbl.configure(text=f"Pot: {fmt_money(st.pot)}")
-        self._call_lbl.configure(text=f"À payer: {fmt_money(st.to_call)}")
-        self._stack_lbl.configure(text=f"Stack: {fmt_money(st.hero_stack)}")
+        self._set_text(self._pot_lbl, "pot", f"Pot: {fmt_money(st.pot)}")
+        self._set_text(self._call_lbl, "call", f"À payer: {fmt_money(st.to_call)}")
+        self._set_text(self._stack_lbl, "stack", f"Stack: {fmt_money(st.hero_stack)}")
 
         # action
         action = (pol.get("action") or "—").upper()
@@ -319,12 +352,18 @@ class PokerHUD(ctk.CTk):
         self._pill.set(pill_text, conf)
 
         if action == "RAISE" and size:
-            self._action_lbl.configure(text="RAISE")
-            self._size_lbl.configure(text=f"{size:.1f} bb  •  {reason}")
+            self._set_text(self._action_lbl, "action", "RAISE")
+            self._set_text(self._size_lbl, "size", f"{size:.1f} bb  •  {reason}")
         else:
-            self._action_lbl.configure(text=action)
-            self._size_lbl.configure(text=reason)
+            self._set_text(self._action_lbl, "action", action)
+            self._set_text(self._size_lbl, "size", reason)
         self._bar.set(conf)
+
+    def _set_text(self, lbl, key: str, text: str):
+        """configure(text=...) seulement si le texte a changé (CTk recalcule la géométrie à chaque appel)."""
+        if self._txt_cache.get(key) != text:
+            lbl.configure(text=text)
+            self._txt_cache[key] = text
     
     def _street_text(self, st: "HandState") -> str:
         try:
@@ -346,5 +385,5 @@ class PokerHUD(ctk.CTk):
             self._cancel_all_jobs()
         except Exception:
             pass
-        print("👋 Fermeture de l'overlay HUD")
+        logger.info("👋 Fermeture de l'overlay HUD")
         self.destroy()
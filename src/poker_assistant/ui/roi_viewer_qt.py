@@ -1,26 +1,17 @@
 from __future__ import annotations
 
-import argparse, os
+import argparse, os, threading, zlib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List
 
 import numpy as np
-import cv2, mss, yaml, pywinctl
 from PySide6 import QtCore, QtGui, QtWidgets
 
-# --- pywin32 pour PrintWindow (robuste) ---
-try:
-    import win32gui, win32ui, win32con
-    HAS_PYWIN32 = True
-except Exception:
-    HAS_PYWIN32 = False
+from poker_assistant.config import AppSettings, load_room_config, load_yaml_cached
 
-from poker_assistant.config import AppSettings, load_room_config
-try:
-    from poker_assistant.windows.detector import list_poker_tables as _list_tables
-except Exception:
-    _list_tables = None
+# cv2, mss, pywinctl et pywin32 sont importés dans les fonctions qui s'en servent :
+# importer ce module ne charge que numpy et Qt.
 
 
 # ---------------- DPI helpers ----------------
@@ -72,27 +63,81 @@ class PxRect:
     w: int
     h: int
 
+# Session mss par thread, réutilisée d'une frame à l'autre (les handles mss ne se partagent pas entre threads)
+_TLS = threading.local()
+
+def _sct():
+    if getattr(_TLS, "sct", None) is None:
+        import mss
+        _TLS.sct = mss.mss()
+    return _TLS.sct
+
+def close_mss() -> None:
+    """Ferme la session mss du thread courant (recréée au besoin au prochain grab)."""
+    sct = getattr(_TLS, "sct", None)
+    _TLS.sct = None
+    if sct is not None:
+        sct.close()
+
 def grab_rect_mss(rect: PxRect) -> np.ndarray:
-    with mss.mss() as sct:
-        shot = sct.grab({"left": rect.x, "top": rect.y, "width": rect.w, "height": rect.h})
-        bgr = cv2.cvtColor(np.array(shot), cv2.COLOR_BGRA2BGR)
-        return cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+    import cv2
+    monitor = {"left": rect.x, "top": rect.y, "width": rect.w, "height": rect.h}
+    try:
+        shot = _sct().grab(monitor)
+    except Exception:
+        # Session invalidée (changement d'écran/DPI) : on la recrée une fois
+        close_mss()
+        shot = _sct().grab(monitor)
+    # Vue sur le buffer BGRA de mss (sans copie), convertie en RGB en une seule passe
+    bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+    return cv2.cvtColor(bgra, cv2.COLOR_BGRA2RGB)
+
+# GDI de PrintWindow par hwnd : (width, height, hwndDC, mfcDC, saveDC, saveBitMap),
+# recréés seulement quand la taille du client change
+_PW_CACHE: Dict[int, tuple] = {}
+
+def _release_pw(hwnd: int) -> None:
+    entry = _PW_CACHE.pop(hwnd, None)
+    if entry is None:
+        return
+    _, _, hwndDC, mfcDC, saveDC, saveBitMap = entry
+    try:
+        import win32gui
+        win32gui.DeleteObject(saveBitMap.GetHandle())
+        saveDC.DeleteDC(); mfcDC.DeleteDC()
+        win32gui.ReleaseDC(hwnd, hwndDC)
+    except Exception:
+        pass
+
+def release_printwindow_cache() -> None:
+    """Libère tous les DC/bitmaps PrintWindow conservés (à la fermeture du viewer)."""
+    for hwnd in list(_PW_CACHE):
+        _release_pw(hwnd)
 
 def grab_window_printwindow(hwnd: int) -> Optional[np.ndarray]:
     """Capture le CLIENT RECT via PrintWindow (ne dépend pas de l'écran, évite la récursion)."""
-    if not HAS_PYWIN32:
+    # --- pywin32 pour PrintWindow (robuste) ---
+    try:
+        import win32gui, win32ui
+    except Exception:
         return None
+    import cv2
     try:
         cx, cy, cw, ch = _get_client_rect_logical(hwnd)
         px, py, pw, ph, _ = _logical_to_physical_rect(cx, cy, cw, ch, hwnd)
         width, height = max(1, pw), max(1, ph)
 
-        hwndDC = win32gui.GetWindowDC(hwnd)
-        mfcDC  = win32ui.CreateDCFromHandle(hwndDC)
-        saveDC = mfcDC.CreateCompatibleDC()
-        saveBitMap = win32ui.CreateBitmap()
-        saveBitMap.CreateCompatibleBitmap(mfcDC, width, height)
-        saveDC.SelectObject(saveBitMap)
+        entry = _PW_CACHE.get(hwnd)
+        if entry is None or entry[:2] != (width, height):
+            _release_pw(hwnd)
+            hwndDC = win32gui.GetWindowDC(hwnd)
+            mfcDC  = win32ui.CreateDCFromHandle(hwndDC)
+            saveDC = mfcDC.CreateCompatibleDC()
+            saveBitMap = win32ui.CreateBitmap()
+            saveBitMap.CreateCompatibleBitmap(mfcDC, width, height)
+            saveDC.SelectObject(saveBitMap)
+            entry = _PW_CACHE[hwnd] = (width, height, hwndDC, mfcDC, saveDC, saveBitMap)
+        saveDC, saveBitMap = entry[4], entry[5]
 
         flags = 0x00000001 | 0x00000002  # PW_CLIENTONLY | PW_RENDERFULLCONTENT
         win32gui.PrintWindow(hwnd, saveDC.GetSafeHdc(), flags)
@@ -100,23 +145,21 @@ def grab_window_printwindow(hwnd: int) -> Optional[np.ndarray]:
         bmpinfo = saveBitMap.GetInfo()
         bmpstr  = saveBitMap.GetBitmapBits(True)
 
-        # Cleanup GDI
-        win32gui.DeleteObject(saveBitMap.GetHandle())
-        saveDC.DeleteDC(); mfcDC.DeleteDC()
-        win32gui.ReleaseDC(hwnd, hwndDC)
-
-        # BGRA -> RGB numpy
+        # BGRA -> RGB numpy (une seule passe)
         img = np.frombuffer(bmpstr, dtype=np.uint8)
         img.shape = (bmpinfo['bmHeight'], bmpinfo['bmWidth'], 4)
-        bgr = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-        return cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+        return cv2.cvtColor(img, cv2.COLOR_BGRA2RGB)
     except Exception:
+        _release_pw(hwnd)
         return None
 
 def is_uniform_frame(img: np.ndarray, thr_std: float = 2.0) -> bool:
     if img is None or img.size == 0:
         return True
-    return float(img.std()) < thr_std  # blanc/noir quasi uniforme
+    import cv2
+    # meanStdDev travaille directement sur l'uint8 (pas de temporaire float64 plein cadre)
+    _, std = cv2.meanStdDev(img)
+    return float(std.mean()) < thr_std  # blanc/noir quasi uniforme
 
 
 # ---------------- Normalization helpers ----------------
@@ -134,6 +177,18 @@ def roi_to_abs(win_bbox: Tuple[int,int,int,int], anchors: Dict[str, dict], roi:
     rh = max(1, int(roi["h"] * ah * wh))
     return rx, ry, rw, rh
 
+def rois_to_abs(win_bbox: Tuple[int,int,int,int], roi_norm: np.ndarray) -> np.ndarray:
+    """Version vectorisée de roi_to_abs : roi_norm (N, 8) = [x, y, w, h, ax, ay, aw, ah]
+    (ancre déjà résolue) -> (N, 4) int32 [rx, ry, rw, rh], mêmes arrondis (troncature)."""
+    wx, wy, ww, wh = win_bbox
+    x, y, w, h, ax, ay, aw, ah = roi_norm.T
+    out = np.empty((roi_norm.shape[0], 4), dtype=np.int32)
+    out[:, 0] = wx + ((ax + x * aw) * ww).astype(np.int32)
+    out[:, 1] = wy + ((ay + y * ah) * wh).astype(np.int32)
+    out[:, 2] = np.maximum(1, (w * aw * ww).astype(np.int32))
+    out[:, 3] = np.maximum(1, (h * ah * wh).astype(np.int32))
+    return out
+
 
 # ---------------- Sélection fenêtre cible ----------------
 @dataclass
@@ -143,6 +198,10 @@ class TargetWindow:
     bbox_logical: Tuple[int, int, int, int]
 
 def _pick_table_for_room(room: str) -> TargetWindow:
+    try:
+        from poker_assistant.windows.detector import list_poker_tables as _list_tables
+    except Exception:
+        _list_tables = None
     room = room.lower()
     if _list_tables:
         try:
@@ -154,6 +213,7 @@ def _pick_table_for_room(room: str) -> TargetWindow:
         except Exception:
             pass
     # fallback simple par titre
+    import pywinctl
     cands: List[TargetWindow] = []
     for w in pywinctl.getAllWindows():
         try:
@@ -172,6 +232,61 @@ def _pick_table_for_room(room: str) -> TargetWindow:
     return t
 
 
+# ---------------- Capture (thread dédié) ----------------
+class CaptureWorker(QtCore.QObject):
+    """Capture PrintWindow/MSS + conversion RGB hors du thread GUI.
+
+    Vit dans un QThread : son timer, la session mss (thread-local) et le cache GDI
+    PrintWindow appartiennent tous à ce thread. Émet (frame RGB ou None, win_bbox physique).
+    """
+    frame_ready = QtCore.Signal(object, object)
+
+    def __init__(self, hwnd: Optional[int], win_bbox: Tuple[int, int, int, int], fps: int):
+        super().__init__()
+        self.hwnd = hwnd
+        self.win_bbox = win_bbox
+        self.fps = fps
+        self.timer: Optional[QtCore.QTimer] = None
+
+    @QtCore.Slot()
+    def start(self) -> None:
+        # Créé ici (et non dans __init__) pour que le timer appartienne au thread de capture
+        self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)  # cadence stable (pas de granularité 15.6 ms)
+        self.timer.timeout.connect(self._capture)
+        self.timer.start(int(1000 / self.fps))
+
+    @QtCore.Slot()
+    def stop(self) -> None:
+        if self.timer is not None:
+            self.timer.stop()
+        close_mss()
+        release_printwindow_cache()
+
+    def _capture(self) -> None:
+        # Suivre le client rect (physique)
+        try:
+            if self.hwnd:
+                cx, cy, cw, ch = _get_client_rect_logical(self.hwnd)
+                px_x, px_y, px_w, px_h, _ = _logical_to_physical_rect(cx, cy, cw, ch, self.hwnd)
+                self.win_bbox = (px_x, px_y, px_w, px_h)
+        except Exception:
+            self.timer.stop()
+            return
+
+        # 1) PrintWindow (robuste, hors-écran)
+        frame_rgb = grab_window_printwindow(self.hwnd) if self.hwnd else None
+
+        # 2) Fallback MSS (si PrintWindow indisponible)
+        if frame_rgb is None or is_uniform_frame(frame_rgb):
+            try:
+                frame_rgb = grab_rect_mss(PxRect(*self.win_bbox))
+            except Exception:
+                frame_rgb = None
+
+        self.frame_ready.emit(frame_rgb, self.win_bbox)
+
+
 # ---------------- Viewer temps réel ----------------
 class LiveRoiViewer(QtWidgets.QMainWindow):
     def __init__(self, room: str, settings: Optional[AppSettings] = None, fps: int = 20):
@@ -180,6 +295,22 @@ class LiveRoiViewer(QtWidgets.QMainWindow):
         self.room = room.lower()
         self.setWindowTitle(f"ROI Live Viewer — {room}")
         self.fps = max(5, min(60, fps))
+        self._blank: Optional[np.ndarray] = None   # image "Capture indisponible"
+        self._qimg: Optional[QtGui.QImage] = None  # QImage à stockage propre, rempli via bits()
+        self._last_sig: Optional[tuple] = None  # empreinte de la dernière frame affichée
+        self._frame: Optional[np.ndarray] = None  # dernière frame reçue du thread de capture
+        # Redessin différé via la boucle d'événements : une rafale de frames/resize -> un seul rendu
+        self._redraw_timer = QtCore.QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(0)
+        self._redraw_timer.timeout.connect(self._render)
+        self._resizing = False  # redimensionnement en cours : FastTransformation
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(150)
+        self._resize_timer.timeout.connect(self._end_resize)
+        self._roi_cache_key: Optional[Tuple[int, ...]] = None  # (w, h) du client pour _roi_cache
+        self._roi_cache: List[Tuple[str, int, int, int, int, Tuple[int, int, int]]] = []
 
         tgt = _pick_table_for_room(self.room)
         self.hwnd = tgt.handle
@@ -203,11 +334,11 @@ class LiveRoiViewer(QtWidgets.QMainWindow):
         self.cfg = load_room_config(self.room, self.settings)
         try:
             yaml_path = (self.settings.ROOMS_DIR / f"{self.room}.yaml").resolve()
-            with yaml_path.open("r", encoding="utf-8") as f:
-                raw = yaml.safe_load(f) or {}
+            raw = load_yaml_cached(yaml_path)
             self.rois_raw = raw.get("rois", {})
         except Exception:
             self.rois_raw = {}
+        self._build_roi_norm()
 
         # (Optionnel) Exclure cette fenêtre de la capture écran (Windows 10 2004+)
         if IS_WIN:
@@ -220,50 +351,118 @@ class LiveRoiViewer(QtWidgets.QMainWindow):
 
         QtGui.QShortcut(QtGui.QKeySequence("Esc"), self, activated=self.close)
 
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self._tick)
-        self.timer.start(int(1000 / self.fps))
-
-    def _tick(self) -> None:
-        # Suivre le client rect (physique)
-        try:
-            if self.hwnd:
-                cx, cy, cw, ch = _get_client_rect_logical(self.hwnd)
-                px_x, px_y, px_w, px_h, _ = _logical_to_physical_rect(cx, cy, cw, ch, self.hwnd)
-                self.win_bbox = (px_x, px_y, px_w, px_h)
-        except Exception:
-            self.timer.stop()
+        # Capture sur un QThread : le thread GUI ne fait plus que overlays + mise à l'échelle
+        self._capture_thread = QtCore.QThread(self)
+        self._worker = CaptureWorker(self.hwnd, self.win_bbox, self.fps)
+        self._worker.moveToThread(self._capture_thread)
+        self._capture_thread.started.connect(self._worker.start)
+        self._worker.frame_ready.connect(self._on_frame)
+        self._capture_thread.start()
+
+    @QtCore.Slot(object, object)
+    def _on_frame(self, frame_rgb: Optional[np.ndarray], win_bbox: Tuple[int, int, int, int]) -> None:
+        self.win_bbox = win_bbox
+        if frame_rgb is None:
+            w, h = max(1, self.win_bbox[2]), max(1, self.win_bbox[3])
+            if self._blank is None or self._blank.shape[:2] != (h, w):
+                import cv2
+                self._blank = np.zeros((h, w, 3), dtype=np.uint8)
+                cv2.putText(self._blank, "Capture indisponible", (20, 40),
+                            cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255,255,255), 2, cv2.LINE_AA)
+            frame_rgb = self._blank
+        # Seule la dernière frame est gardée : si le GUI est plus lent que la capture,
+        # les frames intermédiaires sont remplacées avant d'être rendues
+        self._frame = frame_rgb
+        self._redraw_timer.start()
+
+    def _render(self) -> None:
+        frame_rgb = self._frame
+        if frame_rgb is None:
             return
 
-        # 1) PrintWindow (robuste, hors-écran)
-        frame_rgb = grab_window_printwindow(self.hwnd) if self.hwnd else None
-
-        # 2) Fallback MSS (si PrintWindow indisponible)
-        if frame_rgb is None or is_uniform_frame(frame_rgb):
-            try:
-                frame_rgb = grab_rect_mss(PxRect(*self.win_bbox))
-            except Exception:
-                frame_rgb = None
-
-        if frame_rgb is None:
-            w, h = self.win_bbox[2], self.win_bbox[3]
-            frame_rgb = np.zeros((max(1, h), max(1, w), 3), dtype=np.uint8)
-            cv2.putText(frame_rgb, "Capture indisponible", (20, 40),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255,255,255), 2, cv2.LINE_AA)
+        # Frame identique (crc32 de la frame entière) et même taille d'affichage : on garde le pixmap courant
+        data = frame_rgb.data if frame_rgb.flags.c_contiguous else frame_rgb.tobytes()
+        sig = (zlib.crc32(data), frame_rgb.shape, self.label.width(), self.label.height())
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
 
         H, W = frame_rgb.shape[:2]
-        canvas = frame_rgb.copy()
+        # Label beaucoup plus petit que la capture : réduction INTER_AREA vers ~2x la taille
+        # du label, le lissage Qt final ne porte plus que sur une petite image
+        f = min(2 * self.label.width() / W, 2 * self.label.height() / H)
+        dw, dh = (max(1, int(W * f)), max(1, int(H * f))) if f <= 0.5 else (W, H)
+        scale = dw / W
+
+        # La frame est écrite directement dans le buffer du QImage (réutilisé tant que la
+        # taille ne change pas) : resize/copie vers la vue numpy, puis un seul fromImage
+        if self._qimg is None or (self._qimg.width(), self._qimg.height()) != (dw, dh):
+            self._qimg = QtGui.QImage(dw, dh, QtGui.QImage.Format.Format_RGB888)
+        canvas = self._qimg_view()
+        if (dw, dh) != (W, H):
+            import cv2
+            cv2.resize(frame_rgb, (dw, dh), dst=canvas, interpolation=cv2.INTER_AREA)
+        else:
+            np.copyto(canvas, frame_rgb)
+        pix  = QtGui.QPixmap.fromImage(self._qimg)
+        self._paint_overlays(pix, scale)
+        if pix.size() == self.label.size():
+            self.label.setPixmap(pix)
+            return
+        # Pendant un redimensionnement : mise à l'échelle rapide, la version lissée suit à la fin
+        mode = (QtCore.Qt.TransformationMode.FastTransformation if self._resizing
+                else QtCore.Qt.TransformationMode.SmoothTransformation)
+        self.label.setPixmap(pix.scaled(self.label.size(), QtCore.Qt.AspectRatioMode.KeepAspectRatio, mode))
+
+    def _qimg_view(self) -> np.ndarray:
+        """Vue numpy (H, W, 3) inscriptible sur les pixels de self._qimg (lignes alignées
+        sur 4 octets par Qt : on ignore le padding de fin de ligne)."""
+        img = self._qimg
+        w, h, bpl = img.width(), img.height(), img.bytesPerLine()
+        # bits() à chaque frame : détache le QImage s'il est encore partagé avec un pixmap
+        buf = np.frombuffer(img.bits(), dtype=np.uint8, count=h * bpl)
+        return buf.reshape(h, bpl)[:, :w * 3].reshape(h, w, 3)
+
+    def _paint_overlays(self, pix: QtGui.QPixmap, scale: float = 1.0) -> None:
+        """Rectangles + libellés des anchors/ROIs en une seule passe QPainter sur le pixmap
+        (coordonnées client ramenées à celles du pixmap via `scale`)."""
+        painter = QtGui.QPainter(pix)
+        try:
+            if scale != 1.0:
+                painter.scale(scale, scale)
+            painter.setRenderHint(QtGui.QPainter.RenderHint.TextAntialiasing)
+            font = painter.font(); font.setPixelSize(13); painter.setFont(font)
+            text_pen = QtGui.QPen(QtGui.QColor(240, 240, 240))
+            last_color = None
+            for label, rx, ry, rw, rh, color in self._overlay_rects():
+                if color != last_color:
+                    rect_pen = QtGui.QPen(QtGui.QColor(*color), 2)
+                    last_color = color
+                painter.setPen(rect_pen)
+                painter.drawRect(rx, ry, rw, rh)
+                painter.setPen(text_pen)
+                painter.drawText(rx + 6, ry + 18, label)
+        finally:
+            painter.end()
+
+    def _end_resize(self) -> None:
+        self._resizing = False
+        self._last_sig = None  # force le rendu lissé de la frame courante
+        self._redraw_timer.start()
+
+    def _build_roi_norm(self) -> None:
+        """Table statique (libellé, couleur) + tableau (N, 8) des anchors/ROIs normalisés,
+        ancre 'ref' déjà résolue : construite une fois après le chargement de la config."""
+        labels: List[Tuple[str, Tuple[int, int, int]]] = []
+        rows: List[Tuple[float, ...]] = []
 
         # Anchors (verts)
-        anchors_norm: Dict[str, dict] = {}
+        anchors_norm: Dict[str, Tuple[float, float, float, float]] = {}
         if self.cfg.anchors:
             for name, a in self.cfg.anchors.items():
-                anchors_norm[name] = {"x": a.x, "y": a.y, "w": a.w, "h": a.h}
-                rx, ry, rw, rh = roi_to_abs(self.win_bbox, {}, {"ref": "window", "x": a.x, "y": a.y, "w": a.w, "h": a.h})
-                rx -= self.win_bbox[0]; ry -= self.win_bbox[1]
-                cv2.rectangle(canvas, (rx, ry), (rx + rw, ry + rh), (0, 230, 118), 2)
-                cv2.putText(canvas, f"[anchor] {name}", (rx + 6, ry + 18),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.55, (240,240,240), 1, cv2.LINE_AA)
+                anchors_norm[name] = (a.x, a.y, a.w, a.h)
+                labels.append((f"[anchor] {name}", (0, 230, 118)))
+                rows.append((a.x, a.y, a.w, a.h, 0.0, 0.0, 1.0, 1.0))
 
         # ROIs (bleus) avec support du 'ref'
         if self.cfg.rois:
@@ -272,22 +471,38 @@ class LiveRoiViewer(QtWidgets.QMainWindow):
                 raw = self.rois_raw.get(name, {})
                 if isinstance(raw, dict):
                     ref_name = raw.get("ref", "window")
-                rd = {"x": r.x, "y": r.y, "w": r.w, "h": r.h, "ref": ref_name}
-                rx, ry, rw, rh = roi_to_abs(self.win_bbox, anchors_norm, rd)
-                rx -= self.win_bbox[0]; ry -= self.win_bbox[1]
-                cv2.rectangle(canvas, (rx, ry), (rx + rw, ry + rh), (79, 195, 247), 2)
-                cv2.putText(canvas, name, (rx + 6, ry + 18),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.55, (240,240,240), 1, cv2.LINE_AA)
-
-        qimg = QtGui.QImage(canvas.data, W, H, W * 3, QtGui.QImage.Format.Format_RGB888).copy()
-        pix  = QtGui.QPixmap.fromImage(qimg)
-        self.label.setPixmap(pix.scaled(self.label.size(), QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                                        QtCore.Qt.TransformationMode.SmoothTransformation))
+                anchor = (0.0, 0.0, 1.0, 1.0) if ref_name == "window" else anchors_norm[ref_name]
+                labels.append((name, (79, 195, 247)))
+                rows.append((r.x, r.y, r.w, r.h) + anchor)
+
+        self._roi_labels = labels
+        self._roi_norm = np.array(rows, dtype=np.float64).reshape(-1, 8)
+
+    def _overlay_rects(self) -> List[Tuple[str, int, int, int, int, Tuple[int, int, int]]]:
+        """Rectangles (libellé, x, y, w, h, couleur) relatifs au client, recalculés seulement
+        quand la taille du client change (un simple déplacement de la table ne les change pas)."""
+        key = self.win_bbox[2:]
+        if key == self._roi_cache_key:
+            return self._roi_cache
+        boxes = rois_to_abs((0, 0) + tuple(key), self._roi_norm).tolist()
+        rects = [(label, rx, ry, rw, rh, color)
+                 for (label, color), (rx, ry, rw, rh) in zip(self._roi_labels, boxes, strict=True)]
+        self._roi_cache_key, self._roi_cache = key, rects
+        return rects
 
     def resizeEvent(self, ev: QtGui.QResizeEvent) -> None:
-        self._tick()
+        self._resizing = True
+        self._resize_timer.start()  # relancé à chaque événement : se déclenche 150 ms après le dernier
+        self._redraw_timer.start()  # rafale de resize -> un seul redessin
         super().resizeEvent(ev)
 
+    def closeEvent(self, ev: QtGui.QCloseEvent) -> None:
+        # Arrêt dans le thread de capture (mss/GDI y ont été créés), puis fin du thread
+        if self._capture_thread.isRunning():
+            QtCore.QMetaObject.invokeMethod(self._worker, "stop", QtCore.Qt.ConnectionType.BlockingQueuedConnection)
+            self._capture_thread.quit()
+            self._capture_thread.wait()
+        super().closeEvent(ev)
 
 # ---------------- CLI ----------------
 def main() -> None:
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import tkinter as tk
 from typing import List, Optional
 
 from ..windows.detector import CandidateWindow, detect_poker_tables
@@ -24,7 +23,9 @@ def choose_table(room_pref: Optional[str] = None) -> Optional[CandidateWindow]:
         print(f"Auto-sélection: {candidates[0].title} ({candidates[0].room_guess})")
         return candidates[0]
 
-    # Multiple candidates - show selector
+    # Multiple candidates - show selector (tkinter only loaded here)
+    import tkinter as tk
+
     root = tk.Tk()
     root.title("Choisir la table (Winamax/PMU)")
     root.geometry("800x400")
@@ -37,15 +38,17 @@ def choose_table(room_pref: Optional[str] = None) -> Optional[CandidateWindow]:
     listbox = tk.Listbox(root, width=100, height=12, font=("Consolas", 10))
     listbox.pack(padx=20, pady=10, fill="both", expand=True)
     
-    # Add candidates to listbox
-    for i, c in enumerate(candidates):
-        room = c.room_guess or "?"
-        size = f"{c.bbox[2]-c.bbox[0]}x{c.bbox[3]-c.bbox[1]}"
-        item = f"[{i}] {room.upper()} | Score: {c.score:.2f} | {size} | {c.title}"
-        listbox.insert(tk.END, item)
+    # Add candidates to listbox (single variadic insert = one Tcl call)
+    items = [
+        f"[{i}] {(c.room_guess or '?').upper()} | Score: {c.score:.2f} | "
+        f"{c.bbox[2]-c.bbox[0]}x{c.bbox[3]-c.bbox[1]} | {c.title}"
+        for i, c in enumerate(candidates)
+    ]
+    listbox.insert(tk.END, *items)
     
     # Select first item by default
     listbox.selection_set(0)
+    listbox.selection_anchor(0)
     
     chosen: dict = {"value": None}
     
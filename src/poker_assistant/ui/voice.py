@@ -1,6 +1,10 @@
+"""Voice synthesis stub using pyttsx3 (optional)."""
+
 from __future__ import annotations
 
-"""Voice synthesis stub using pyttsx3 (optional)."""
+import queue
+import threading
+from typing import Optional
 
 try:
     import pyttsx3  # type: ignore
@@ -9,11 +13,64 @@ except Exception:  # pragma: no cover - optional dependency
 
 
 class Speaker:  # pragma: no cover - side-effectful I/O
+    """Non-blocking speaker: say() only enqueues, a daemon thread runs pyttsx3.
+
+    The engine is created inside the worker thread (SAPI/COM engines are bound to
+    the thread that initialised them). At most 4 phrases wait; extra ones are dropped
+    rather than building a backlog of stale advice.
+    """
+
     def __init__(self) -> None:
-        self.engine = pyttsx3.init() if pyttsx3 is not None else None
+        self.engine = None
+        self._q: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=4)
+        self._thread: Optional[threading.Thread] = None
+        if pyttsx3 is not None:
+            self._thread = threading.Thread(target=self._worker, name="speaker", daemon=True)
+            self._thread.start()
 
     def say(self, text: str) -> None:
-        if self.engine is None:
+        if self._thread is None:
             return
-        self.engine.say(text)
-        self.engine.runAndWait()
+        try:
+            self._q.put_nowait(text)
+        except queue.Full:
+            pass
+
+    def close(self) -> None:
+        """Arrête le thread de synthèse (libère le moteur et COM sur son thread)."""
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        try:
+            self._q.put(None, timeout=1.0)
+        except queue.Full:
+            return
+        thread.join(timeout=2.0)
+
+    def _worker(self) -> None:
+        # SAPI5 (Windows) passe par COM : à initialiser sur ce thread avant pyttsx3.init()
+        try:
+            import comtypes  # type: ignore  # dépendance de pyttsx3 sous Windows
+        except Exception:
+            comtypes = None
+        if comtypes is not None:
+            comtypes.CoInitialize()
+        try:
+            try:
+                self.engine = pyttsx3.init()
+            except Exception:
+                self._thread = None
+                return
+            while True:
+                text = self._q.get()
+                if text is None:
+                    break
+                try:
+                    self.engine.say(text)
+                    self.engine.runAndWait()
+                except Exception:
+                    pass
+        finally:
+            self.engine = None
+            if comtypes is not None:
+                comtypes.CoUninitialize()
@@ -0,0 +1,71 @@
+"""Direct top-level window enumeration via EnumWindows (ctypes, Windows only).
+
+One pass per window: visibility, rect, title and pid are read together, instead of
+the per-attribute win32 round-trips of pygetwindow/pywinctl Window objects.
+"""
+
+from __future__ import annotations
+
+import ctypes
+from ctypes import wintypes
+from typing import Iterator, List, Tuple
+
+try:
+    _user32 = ctypes.windll.user32
+except AttributeError as e:  # not Windows
+    raise ImportError("EnumWindows enumeration requires Windows") from e
+
+WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+_user32.EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+_user32.EnumWindows.restype = wintypes.BOOL
+_user32.IsWindowVisible.argtypes = [wintypes.HWND]
+_user32.IsWindowVisible.restype = wintypes.BOOL
+_user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+_user32.GetWindowRect.restype = wintypes.BOOL
+_user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+_user32.GetWindowTextW.restype = ctypes.c_int
+_user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+_user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+
+# Cloaked windows (UWP/virtual desktops) report as visible but are not on screen
+try:
+    _dwmapi = ctypes.windll.dwmapi
+    _dwmapi.DwmGetWindowAttribute.argtypes = [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD]
+    _dwmapi.DwmGetWindowAttribute.restype = ctypes.c_long
+except (AttributeError, OSError):
+    _dwmapi = None
+_DWMWA_CLOAKED = 14
+
+_TITLE_LEN = 256
+
+# (hwnd, title, (left, top, right, bottom), pid)
+WindowInfo = Tuple[int, str, Tuple[int, int, int, int], int]
+
+
+def enum_windows() -> Iterator[WindowInfo]:
+    """Visible (not cloaked), non-zero-area top-level windows in Z-order (titles may be empty)."""
+    found: List[WindowInfo] = []
+    title = ctypes.create_unicode_buffer(_TITLE_LEN)
+    rect = wintypes.RECT()
+    pid = wintypes.DWORD()
+    cloaked = wintypes.DWORD()
+
+    def _visit(hwnd, _lparam):
+        # Cheap filters first: no title read for hidden or zero-area windows
+        if not hwnd or not _user32.IsWindowVisible(hwnd):
+            return True
+        if not _user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+            return True
+        if rect.right <= rect.left or rect.bottom <= rect.top:
+            return True
+        if _dwmapi is not None and _dwmapi.DwmGetWindowAttribute(
+                hwnd, _DWMWA_CLOAKED, ctypes.byref(cloaked), ctypes.sizeof(cloaked)) == 0 and cloaked.value:
+            return True
+        _user32.GetWindowTextW(hwnd, title, _TITLE_LEN)
+        _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+        found.append((int(hwnd), title.value, (rect.left, rect.top, rect.right, rect.bottom), int(pid.value)))
+        return True
+
+    _user32.EnumWindows(WNDENUMPROC(_visit), 0)
+    yield from found
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import re
+import time
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 
 try:
     import pygetwindow as gw
@@ -11,8 +15,29 @@ except ImportError:
     # Fallback to pywinctl if pygetwindow not available
     import pywinctl as gw
 
+# Window helpers (pywin32, Windows only)
+try:
+    import win32gui
+except ImportError:
+    win32gui = None
+
+# Process lookup helpers, imported once (psutil is optional)
+try:
+    import psutil
+    import win32process
+    _HAVE_WIN32 = True
+except ImportError:
+    psutil = win32process = None
+    _HAVE_WIN32 = False
+
+try:
+    # Direct EnumWindows walk (Windows); pygetwindow/pywinctl stay as the fallback
+    from ._win32_enum import enum_windows as _enum_windows
+except ImportError:
+    _enum_windows = None
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CandidateWindow:
     handle: int
     title: str
@@ -118,73 +143,215 @@ BLACKLIST_TITLE_SUBSTR = (
 )
 
 
+TABLE_TITLE_KEYWORDS = ("table", "cash", "ring", "hold'em", "holdem", "texas", "omaha", "poker")
+LOBBY_TITLE_KEYWORDS = ("lobby", "home", "accueil", "main", "principal", "tournoi", "tournament")
+
+
+def _any_substr_re(words) -> "re.Pattern[str]":
+    """One compiled alternation: a single scan replaces any(w in s for w in words)."""
+    return re.compile("|".join(map(re.escape, words)))
+
+
+_WL_PROC_RE = _any_substr_re(WHITELIST_PROCESS_SUBSTR)
+
+# Single-word blacklist entries: hashed whole-word lookup as an early reject
+# (a word hit is always also a substring hit, so this never changes the result)
+_BL_WORDS = frozenset(w for w in BLACKLIST_TITLE_SUBSTR if w.isalnum())
+
+# Title keyword categories, as bits of a single mask
+_BL_BIT, _WL_TITLE_BIT, _TABLE_BIT, _LOBBY_BIT, _WINAMAX_BIT, _PMU_BIT = 1, 2, 4, 8, 16, 32
+
+
+def _keyword_masks() -> Dict[str, int]:
+    masks: Dict[str, int] = {}
+    for words, bit in (
+        (BLACKLIST_TITLE_SUBSTR, _BL_BIT),
+        (WHITELIST_TITLE_SUBSTR, _WL_TITLE_BIT),
+        (TABLE_TITLE_KEYWORDS, _TABLE_BIT),
+        (LOBBY_TITLE_KEYWORDS, _LOBBY_BIT),
+        (("winamax",), _WINAMAX_BIT),
+        (("pmu",), _PMU_BIT),
+    ):
+        for w in words:
+            masks[w] = masks.get(w, 0) | bit
+    return masks
+
+
+_KEYWORD_MASKS = _keyword_masks()
+# Lookahead alternation: one match per start position, so overlapping keywords are all seen
+_TITLE_KEYWORDS_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_KEYWORD_MASKS, key=len, reverse=True))) + "))"
+)
+
+
+@lru_cache(maxsize=2048)
+def _categorize(title_norm: str) -> int:
+    """Single pass over the title -> bitmask of matched keyword categories (memoized per title)."""
+    # Whole-word blacklist hit: hashed lookup, no regex scan needed
+    if not _BL_WORDS.isdisjoint(title_norm.split()):
+        return _BL_BIT
+    mask = 0
+    for m in _TITLE_KEYWORDS_RE.finditer(title_norm):
+        mask |= _KEYWORD_MASKS[m.group(1)]
+    return mask
+
+
+@lru_cache(maxsize=2048)
 def _norm(s: str) -> str:
     """Normalize string for comparison."""
     return s.lower().strip() if s else ""
 
 
+@lru_cache(maxsize=1024)
+def _hwnd_to_pid(hwnd: int) -> int:
+    """PID owning a window handle (cached; flushed with each pid->name sweep, HWNDs get reused)."""
+    if not _HAVE_WIN32:
+        raise OSError("win32process unavailable")
+    _, pid = win32process.GetWindowThreadProcessId(hwnd)
+    return pid
+
+
+_PID_NAMES_TTL_S = 5.0
+# Unknown PID (process launched since the last sweep): earliest forced re-sweep
+_PID_NAMES_MISS_S = 0.5
+_pid_names: Dict[int, str] = {}
+_pid_names_ts: float = float("-inf")
+
+
+def _pid_name_map(max_age_s: float = _PID_NAMES_TTL_S) -> Dict[int, str]:
+    """{pid: process name} from one psutil.process_iter sweep, rebuilt once older than max_age_s."""
+    global _pid_names, _pid_names_ts
+    now = time.monotonic()
+    if now - _pid_names_ts >= max_age_s:
+        names: Dict[int, str] = {}
+        try:
+            for p in psutil.process_iter(["pid", "name"]):
+                names[p.info["pid"]] = p.info["name"] or ""
+        except Exception:
+            pass
+        _pid_names, _pid_names_ts = names, now
+        _hwnd_to_pid.cache_clear()  # same lifetime as the pid->name map
+    return _pid_names
+
+
+def _pid_to_name(pid: int) -> str:
+    """Process name for a PID (batched psutil sweep, see _pid_name_map), "" if unavailable."""
+    if not _HAVE_WIN32:
+        return ""
+    name = _pid_name_map().get(pid)
+    if name is None:
+        # A scored result is cached until the window list changes: a just-launched
+        # client must not be scored with an empty process name
+        name = _pid_name_map(_PID_NAMES_MISS_S).get(pid, "")
+    return name
+
+
+def _window_proc_name(window) -> str:
+    """Process name of a pygetwindow/pywinctl window object, "" if unavailable."""
+    try:
+        if hasattr(window, '_hWnd'):
+            return _pid_to_name(_hwnd_to_pid(window._hWnd))
+        if hasattr(window, 'getAppName'):
+            # pywinctl method
+            return window.getAppName() or ""
+    except Exception:
+        pass
+    return ""
+
+
+def _iter_windows():
+    """
+    Yield (handle, title, (left, top, right, bottom), proc_name_fn) for each window.
+    The process name is resolved lazily through proc_name_fn(), only for windows
+    that survive the cheap title/size filters.
+    """
+    if _enum_windows is not None:
+        for hwnd, title, rect, pid in _enum_windows():
+            yield hwnd, title, rect, partial(_pid_to_name, pid)
+        return
+
+    # Get all windows (compatible with both pygetwindow and pywinctl)
+    for window in gw.getAllWindows():
+        try:
+            if win32gui is not None and hasattr(window, '_hWnd') and not win32gui.IsWindowVisible(window._hWnd):
+                continue  # hidden tooltips/IME/broker windows never reach the scoring loop
+            handle = 0
+            if hasattr(window, '_hWnd'):
+                handle = window._hWnd
+            elif hasattr(window, 'getHandle'):
+                handle = window.getHandle()
+            left, top = window.left, window.top
+            bbox = (left, top, left + window.width, top + window.height)
+            yield handle, window.title or "", bbox, partial(_window_proc_name, window)
+        except Exception:
+            continue
+
+
+# Last (room_preference, window-list snapshot) and its scored result
+_LAST_SNAPSHOT: Optional[tuple] = None
+_LAST_RESULT: List[CandidateWindow] = []
+
+
 def detect_poker_tables(room_preference: Optional[str] = None) -> List[CandidateWindow]:
     """
-    Detect poker table windows using pygetwindow.
+    Detect poker table windows (EnumWindows, or pygetwindow/pywinctl as fallback).
     Returns list of candidate windows sorted by score (descending).
+    The scored result is reused while the set of (handle, title, bbox) is unchanged.
+    """
+    global _LAST_SNAPSHOT, _LAST_RESULT
+    windows = list(_iter_windows())
+    # Sorted by handle: a focus change (Z-order) alone does not invalidate the cache
+    snapshot = (room_preference, tuple(sorted((w[0], w[1], w[2]) for w in windows)))
+    if snapshot == _LAST_SNAPSHOT:
+        return list(_LAST_RESULT)
+
+    candidates, names_resolved = _score_windows(windows, room_preference)
+    # A window scored without its process name is rescored on the next call
+    _LAST_SNAPSHOT = snapshot if names_resolved else None
+    _LAST_RESULT = candidates
+    return list(candidates)
+
+
+def _score_windows(windows, room_preference: Optional[str]) -> Tuple[List[CandidateWindow], bool]:
+    """
+    Filter and score (handle, title, bbox, proc_name_fn) tuples, best first.
+    Also returns False if a window past the title/size filters had no process name.
     """
     candidates: List[CandidateWindow] = []
-    
-    # Get all windows (compatible with both pygetwindow and pywinctl)
-    try:
-        windows = gw.getAllWindows()
-    except AttributeError:
-        # pywinctl uses different method
-        windows = gw.getAllWindows()
-    
-    for window in windows:
+    names_resolved = True
+
+    for handle, title, bbox, proc_name_fn in windows:
         try:
-            title = window.title or ""
-            proc_name = ""
-            
-            # Try to get process name from title or window object
-            if hasattr(window, '_hWnd'):
-                try:
-                    import psutil
-                    import win32process
-                    _, pid = win32process.GetWindowThreadProcessId(window._hWnd)
-                    proc = psutil.Process(pid)
-                    proc_name = proc.name()
-                except:
-                    # Fallback: extract from title or use empty
-                    proc_name = ""
-            elif hasattr(window, 'getAppName'):
-                # pywinctl method
-                try:
-                    proc_name = window.getAppName() or ""
-                except:
-                    proc_name = ""
-            
-            title_norm = _norm(title)
-            proc_norm = _norm(proc_name)
-            
-            # Check whitelist
-            proc_match = any(p in proc_norm for p in WHITELIST_PROCESS_SUBSTR)
-            title_match = any(t in title_norm for t in WHITELIST_TITLE_SUBSTR)
-            
-            if not proc_match and not title_match:
-                continue
-                
+            # Cheap rejections first (title, size): no process lookup for most windows
+            title_mask = _categorize(_norm(title))
+
             # Check blacklist
-            if any(b in title_norm for b in BLACKLIST_TITLE_SUBSTR):
+            if title_mask & _BL_BIT:
                 continue
-            
+
             # Check size
-            width = window.width
-            height = window.height
+            width = bbox[2] - bbox[0]
+            height = bbox[3] - bbox[1]
             if width < 400 or height < 300:
                 continue
+
+            proc_name = proc_name_fn()
+            if not proc_name:
+                names_resolved = False
+            proc_norm = _norm(proc_name)
+
+            # Check whitelist
+            proc_match = _WL_PROC_RE.search(proc_norm) is not None
+            title_match = bool(title_mask & _WL_TITLE_BIT)
+
+            if not proc_match and not title_match:
+                continue
             
             # Determine room guess
-            if "winamax" in proc_norm or "winamax" in title_norm:
+            if "winamax" in proc_norm or title_mask & _WINAMAX_BIT:
                 room_guess = "winamax"
                 room_score = 0.8
-            elif "pmu" in proc_norm or "pmu" in title_norm:
+            elif "pmu" in proc_norm or title_mask & _PMU_BIT:
                 room_guess = "pmu" 
                 room_score = 0.8
             else:
@@ -199,8 +366,7 @@ def detect_poker_tables(room_preference: Optional[str] = None) -> List[Candidate
             base_score = 0.3
             
             # Bonus for table-related keywords
-            table_keywords = ("table", "cash", "ring", "hold'em", "holdem", "texas", "omaha", "poker")
-            table_bonus = 0.3 if any(t in title_norm for t in table_keywords) else 0.0
+            table_bonus = 0.3 if title_mask & _TABLE_BIT else 0.0
             
             # Bonus for process match
             proc_bonus = 0.2 if proc_match else 0.0
@@ -209,26 +375,18 @@ def detect_poker_tables(room_preference: Optional[str] = None) -> List[Candidate
             room_bonus = 0.2 * room_score
             
             # Penalty for suspicious titles (lobby-like)
-            lobby_keywords = ("lobby", "home", "accueil", "main", "principal", "tournoi", "tournament")
-            lobby_penalty = -0.4 if any(l in title_norm for l in lobby_keywords) else 0.0
+            lobby_penalty = -0.4 if title_mask & _LOBBY_BIT else 0.0
             
             # Size bonus (tables are usually larger)
             size_bonus = 0.1 if width > 800 and height > 600 else 0.0
             
             score = max(0.0, min(1.0, base_score + table_bonus + proc_bonus + room_bonus + lobby_penalty + size_bonus))
             
-            # Create candidate (compatible with both libraries)
-            handle = 0
-            if hasattr(window, '_hWnd'):
-                handle = window._hWnd
-            elif hasattr(window, 'getHandle'):
-                handle = window.getHandle()
-            
             candidate = CandidateWindow(
                 handle=handle,
                 title=title,
                 process=proc_name,
-                bbox=(window.left, window.top, window.left + width, window.top + height),
+                bbox=bbox,
                 room_guess=room_guess,
                 score=score,
             )
@@ -238,6 +396,9 @@ def detect_poker_tables(room_preference: Optional[str] = None) -> List[Candidate
         except Exception:
             continue
     
-    # Sort by score (descending)
-    candidates.sort(key=lambda c: c.score, reverse=True)
-    return candidates
+    # Sort by score (descending, stable: ties keep enumeration order)
+    candidates.sort(key=attrgetter("score"), reverse=True)
+    return candidates, names_resolved
+
+
+__all__ = ["CandidateWindow", "detect_poker_tables"]
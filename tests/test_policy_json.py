@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from poker_assistant.strategy.providers.base import PolicyResponse
 
 
@@ -14,3 +16,16 @@ def test_policy_response_validation() -> None:
     assert obj.action == "call"
     assert obj.size_bb is None
     assert 0 <= obj.confidence <= 1
+
+
+def test_policy_response_validation_from_json_bytes() -> None:
+    # Même chemin que la réponse brute du provider : bytes -> modèle, sans dict intermédiaire
+    payload = {
+        "action": "call",
+        "size_bb": None,
+        "reason_short": "pot odds",
+        "confidence": 0.77,
+    }
+    raw = json.dumps(payload).encode("utf-8")
+    obj = PolicyResponse.model_validate_json(raw)
+    assert obj == PolicyResponse.model_validate(payload)